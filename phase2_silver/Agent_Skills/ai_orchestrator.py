@@ -31,39 +31,83 @@ AUTO_CONFIRM = os.getenv("AUTO_CONFIRM", "false").lower() == "true"
 
 import subprocess
 import json
-import os
 import sys
+import atexit
+import queue
+import threading
 import time
 import random
+import re
 import logging
+import logging.handlers
+import functools
+import itertools
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
 from enum import Enum
 
+# Faster JSON parsing/serialization when orjson is installed
+try:
+    import orjson
+    json_loads = orjson.loads
+
+    def json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode('utf-8')
+except ImportError:
+    json_loads = json.loads
+    json_dumps = json.dumps
+
 # Configuration
 BASE_DIR = Path(__file__).parent
 INBOX_DIR = BASE_DIR / "Inbox"
 LOGS_DIR = BASE_DIR / "Logs"
 AUDIT_LOG = BASE_DIR / "Audit_Log.md"
+INBOX_PATH = os.fspath(INBOX_DIR)  # Plain string for os.scandir
 MAX_RETRIES = 3
 RETRY_DELAY = 2  # seconds
+RETRY_MAX_DELAY = 60  # cap on a single backoff sleep (seconds)
 RALPH_WIGGUM_MAX_ITERATIONS = 10
+MAX_PARALLEL_TASKS = 8  # Messages processed concurrently (AUTO_CONFIRM only)
 WEEKLY_AUDIT_INTERVAL = 7 * 24 * 60 * 60  # 7 days in seconds
+WEEKLY_CHECK_CACHE = 60 * 60  # Re-check the audit log mtime at most hourly
+AUDIT_QUEUE_SIZE = 10000  # Max audit entries waiting for the writer thread
+AUDIT_BATCH_SIZE = 256  # Max entries combined into a single write
 
 # Domain classification
 PERSONAL_DOMAINS = ['gmail', 'whatsapp', 'personal']
 BUSINESS_DOMAINS = ['linkedin', 'facebook', 'instagram', 'twitter', 'x', 'business']
 
-# Setup logging
+# Script mappings (built once at import)
+PERSONAL_SCRIPTS = {
+    'gmail': str(BASE_DIR / 'Watchers' / 'gmail_watcher.py'),
+    'whatsapp': str(BASE_DIR / 'WhatsApp' / 'whatsapp_watcher.py'),
+}
+
+BUSINESS_SCRIPTS = {
+    'linkedin': str(BASE_DIR / 'LinkedIn' / 'linkedin_watcher.py'),
+    'facebook': str(BASE_DIR / 'Watchers' / 'facebook_watcher.py'),
+    'instagram': str(BASE_DIR / 'Watchers' / 'instagram_watcher.py'),
+    'twitter': str(BASE_DIR / 'Watchers' / 'twitter_watcher.py'),
+    'x': str(BASE_DIR / 'Watchers' / 'twitter_watcher.py'),
+}
+
+# Setup logging - records are formatted by the QueueHandler and written to
+# file/console by a listener thread, so worker threads never block on I/O
+_log_queue = queue.Queue()
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(LOGS_DIR / 'orchestrator.log'),
-        logging.StreamHandler()
-    ]
+    handlers=[logging.handlers.QueueHandler(_log_queue)]
+)
+_log_listener = logging.handlers.QueueListener(
+    _log_queue,
+    logging.FileHandler(LOGS_DIR / 'orchestrator.log'),
+    logging.StreamHandler()
 )
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logger = logging.getLogger('AIOrchestrator')
 
 
@@ -83,9 +127,84 @@ class TaskStatus(Enum):
 class AuditLogger:
     """Handles audit logging to Audit_Log.md"""
     
+    __slots__ = ('audit_log_path', '_fd', '_fd_lock', '_queue', '_closed', '_ts_cache', '_writer',
+                 '_weekly_due', '_last_weekly_check')
+    
     def __init__(self, audit_log_path: Path):
         self.audit_log_path = audit_log_path
         self._ensure_audit_log_exists()
+        
+        # Raw O_APPEND descriptor written by a dedicated thread, off the hot
+        # path: each batch is one write() syscall with no extra buffer to flush
+        self._fd = os.open(self.audit_log_path,
+                           os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, 'O_BINARY', 0))
+        self._fd_lock = threading.Lock()
+        self._queue = queue.Queue(maxsize=AUDIT_QUEUE_SIZE)
+        self._closed = False
+        self._ts_cache = (0, "")
+        self._weekly_due = False
+        self._last_weekly_check = None
+        self._writer = threading.Thread(target=self._drain, name='AuditWriter', daemon=True)
+        self._writer.start()
+        atexit.register(self.close)
+    
+    def _timestamp(self) -> str:
+        """ISO timestamp (seconds), formatted once per second and reused"""
+        second = int(time.time())
+        cached_second, cached = self._ts_cache
+        if second != cached_second:
+            cached = datetime.fromtimestamp(second).isoformat(timespec='seconds')
+            self._ts_cache = (second, cached)
+        return cached
+    
+    def _write_now(self, data: bytes):
+        """Write directly to the audit log"""
+        with self._fd_lock:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(self._fd, view):]
+    
+    def _write(self, entry: str):
+        """Queue an entry for the writer thread"""
+        data = entry.encode('utf-8')
+        if self._closed:
+            self._write_now(data)
+            return
+        try:
+            self._queue.put_nowait(data)
+        except queue.Full:
+            # Never drop audit entries - write synchronously instead
+            self._write_now(data)
+    
+    def _drain(self):
+        """Writer thread: batch queued entries into a single write"""
+        while True:
+            item = self._queue.get()
+            batch = []
+            done = item is None
+            if not done:
+                batch.append(item)
+            while not done and len(batch) < AUDIT_BATCH_SIZE:
+                try:
+                    item = self._queue.get(timeout=0.1)
+                except queue.Empty:
+                    break
+                if item is None:
+                    done = True
+                else:
+                    batch.append(item)
+            if batch:
+                self._write_now(b"".join(batch))
+            if done:
+                return
+    
+    def close(self):
+        """Write remaining entries and stop the writer thread"""
+        if self._closed:
+            return
+        self._queue.put(None)
+        self._writer.join()
+        self._closed = True
     
     def _ensure_audit_log_exists(self):
         """Create audit log file if it doesn't exist"""
@@ -96,88 +215,98 @@ class AuditLogger:
                 f.write("## Gold Tier AI Orchestrator Audit Trail\n\n")
                 f.write("---\n\n")
     
+    def _emit(self, header: str, fields: Sequence[Tuple[str, object]] = (), text: str = ""):
+        """Format one audit block (header, optional text, bullet fields) and queue it"""
+        parts = [f"### [{self._timestamp()}] {header}\n\n"]
+        if text:
+            parts.append(f"{text}\n")
+        parts.extend(f"- **{key}**: {value}\n" for key, value in fields)
+        parts.append("\n---\n\n")
+        self._write("".join(parts))
+    
     def log(self, event_type: str, details: str, status: str = "INFO"):
         """Log an audit event with timestamp"""
-        timestamp = datetime.now().isoformat()
-        with open(self.audit_log_path, 'a') as f:
-            f.write(f"### [{timestamp}] {status}: {event_type}\n\n")
-            f.write(f"{details}\n\n")
-            f.write("---\n\n")
+        self._emit(f"{status}: {event_type}", text=details)
     
     def log_task(self, task_id: str, action: str, domain: str, status: str, details: str = ""):
         """Log a task execution with full audit trail"""
-        timestamp = datetime.now().isoformat()
-        with open(self.audit_log_path, 'a') as f:
-            f.write(f"### [{timestamp}] TASK: {task_id}\n\n")
-            f.write(f"- **Action**: {action}\n")
-            f.write(f"- **Domain**: {domain}\n")
-            f.write(f"- **Status**: {status}\n")
-            if details:
-                f.write(f"- **Details**: {details}\n")
-            f.write("\n---\n\n")
+        fields = [("Action", action), ("Domain", domain), ("Status", status)]
+        if details:
+            fields.append(("Details", details))
+        self._emit(f"TASK: {task_id}", fields)
     
     def log_error(self, task_id: str, error: str, attempt: int, max_attempts: int):
         """Log error with retry information"""
-        timestamp = datetime.now().isoformat()
-        with open(self.audit_log_path, 'a') as f:
-            f.write(f"### [{timestamp}] ERROR: {task_id}\n\n")
-            f.write(f"- **Error**: {error}\n")
-            f.write(f"- **Attempt**: {attempt}/{max_attempts}\n")
-            f.write(f"- **Action**: {'Retrying' if attempt < max_attempts else 'Skipping gracefully'}\n\n")
-            f.write("---\n\n")
+        self._emit(f"ERROR: {task_id}", (
+            ("Error", error),
+            ("Attempt", f"{attempt}/{max_attempts}"),
+            ("Action", 'Retrying' if attempt < max_attempts else 'Skipping gracefully'),
+        ))
     
     def log_human_decision(self, task_id: str, action: str, confirmed: bool):
         """Log human-in-the-loop decision"""
-        timestamp = datetime.now().isoformat()
-        status = "CONFIRMED" if confirmed else "DENIED"
-        with open(self.audit_log_path, 'a') as f:
-            f.write(f"### [{timestamp}] HUMAN_DECISION: {task_id}\n\n")
-            f.write(f"- **Action**: {action}\n")
-            f.write(f"- **Decision**: {status}\n\n")
-            f.write("---\n\n")
+        self._emit(f"HUMAN_DECISION: {task_id}", (
+            ("Action", action),
+            ("Decision", "CONFIRMED" if confirmed else "DENIED"),
+        ))
     
     def check_weekly_audit(self) -> bool:
-        """Check if weekly audit is due"""
-        if not self.audit_log_path.exists():
+        """Check if weekly audit is due (result cached for WEEKLY_CHECK_CACHE seconds)"""
+        now = time.monotonic()
+        if self._last_weekly_check is not None and now - self._last_weekly_check < WEEKLY_CHECK_CACHE:
+            return self._weekly_due
+        self._last_weekly_check = now
+        
+        try:
+            mtime = os.stat(self.audit_log_path).st_mtime
+        except FileNotFoundError:
+            self._weekly_due = True
             return True
         
-        last_modified = datetime.fromtimestamp(self.audit_log_path.stat().st_mtime)
+        last_modified = datetime.fromtimestamp(mtime)
         next_audit = last_modified + timedelta(seconds=WEEKLY_AUDIT_INTERVAL)
         
-        if datetime.now() >= next_audit:
+        self._weekly_due = datetime.now() >= next_audit
+        if self._weekly_due:
             self.log("WEEKLY_AUDIT_TRIGGER", 
                     f"Weekly audit triggered. Last audit: {last_modified.isoformat()}")
-            return True
-        return False
+        return self._weekly_due
     
     def weekly_audit_summary(self, tasks_processed: int, errors: int, success_rate: float):
         """Log weekly audit summary"""
-        timestamp = datetime.now().isoformat()
-        with open(self.audit_log_path, 'a') as f:
-            f.write(f"## Weekly Audit Summary - {timestamp}\n\n")
-            f.write(f"- **Tasks Processed**: {tasks_processed}\n")
-            f.write(f"- **Errors**: {errors}\n")
-            f.write(f"- **Success Rate**: {success_rate:.2f}%\n")
-            f.write(f"- **Status**: {'HEALTHY' if success_rate > 90 else 'REVIEW_NEEDED'}\n\n")
-            f.write("---\n\n")
+        timestamp = self._timestamp()
+        self._write(
+            f"## Weekly Audit Summary - {timestamp}\n\n"
+            f"- **Tasks Processed**: {tasks_processed}\n"
+            f"- **Errors**: {errors}\n"
+            f"- **Success Rate**: {success_rate:.2f}%\n"
+            f"- **Status**: {'HEALTHY' if success_rate > 90 else 'REVIEW_NEEDED'}\n\n"
+            "---\n\n"
+        )
 
 
 class MessageClassifier:
     """Classifies messages into personal or business domain"""
     
+    __slots__ = ('personal_keywords', 'business_keywords', '_keyword_re', '_personal_set')
+    
     def __init__(self):
         self.personal_keywords = ['family', 'friend', 'personal', 'home', 'vacation', 
                                   'birthday', 'party', 'dinner', 'casual']
         self.business_keywords = ['work', 'meeting', 'project', 'client', 'business',
                                   'proposal', 'contract', 'deadline', 'professional']
-    
-    def classify(self, message: Dict) -> MessageType:
-        """Classify a message based on content and source"""
-        source = message.get('source', '').lower()
-        subject = message.get('subject', '').lower()
-        content = message.get('content', '').lower()
         
-        # Check source first
+        # One alternation over both domains: a single scan per message. The
+        # lookahead matches at every position, so overlapping keywords
+        # ("homeeting" has both "home" and "meeting") are all found
+        self._keyword_re = re.compile(
+            '(?=(' + '|'.join(map(re.escape, self.personal_keywords + self.business_keywords)) + '))'
+        )
+        self._personal_set = frozenset(self.personal_keywords)
+    
+    @staticmethod
+    def classify_source(source: str) -> MessageType:
+        """Classify by (lowercased) message source alone"""
         for domain in PERSONAL_DOMAINS:
             if domain in source:
                 return MessageType.PERSONAL
@@ -186,10 +315,24 @@ class MessageClassifier:
             if domain in source:
                 return MessageType.BUSINESS
         
-        # Check keywords
-        text = f"{subject} {content}"
-        personal_score = sum(1 for kw in self.personal_keywords if kw in text)
-        business_score = sum(1 for kw in self.business_keywords if kw in text)
+        return MessageType.UNKNOWN
+    
+    def classify(self, message: Dict) -> MessageType:
+        """Classify a message based on content and source"""
+        # Check source first
+        msg_type = self.classify_source(message.get('source', '').lower())
+        if msg_type is not MessageType.UNKNOWN:
+            return msg_type
+        
+        return self.classify_keywords(message)
+    
+    def classify_keywords(self, message: Dict) -> MessageType:
+        """Classify a message by personal/business keywords in subject and content"""
+        # Check keywords (score = number of distinct keywords present)
+        text = f"{message.get('subject', '')} {message.get('content', '')}".lower()
+        found = set(self._keyword_re.findall(text))
+        personal_score = len(found & self._personal_set)
+        business_score = len(found) - personal_score
         
         if personal_score > business_score:
             return MessageType.PERSONAL
@@ -213,16 +356,19 @@ class HumanInTheLoop:
     - Delete operations
     """
 
-    SENSITIVE_ACTIONS = [
+    SENSITIVE_ACTIONS = frozenset({
         'login', 'batch_post', 'financial', 'account_change', 'delete',
         'post', 'linkedin', 'facebook', 'instagram', 'twitter', 'social'
-    ]
+    })
+    SENSITIVE_SUBSTRINGS = tuple(SENSITIVE_ACTIONS)
 
     @staticmethod
+    @functools.lru_cache(maxsize=128)
     def is_sensitive(action: str) -> bool:
         """Check if action requires human confirmation"""
         action_lower = action.lower()
-        return any(kw in action_lower for kw in HumanInTheLoop.SENSITIVE_ACTIONS)
+        return (action_lower in HumanInTheLoop.SENSITIVE_ACTIONS or
+                any(kw in action_lower for kw in HumanInTheLoop.SENSITIVE_SUBSTRINGS))
 
     @staticmethod
     def confirm(action: str, details: str = "") -> bool:
@@ -235,7 +381,7 @@ class HumanInTheLoop:
         Returns: True if confirmed, False if denied
         """
         if AUTO_CONFIRM:
-            logger.info(f"⚙️  AUTO_CONFIRM enabled - skipping confirmation for: {action}")
+            logger.info("⚙️  AUTO_CONFIRM enabled - skipping confirmation for: %s", action)
             return True
 
         if not HumanInTheLoop.is_sensitive(action):
@@ -272,16 +418,26 @@ class HumanInTheLoop:
 class ScriptRunner:
     """Runs watcher/poster scripts via subprocess"""
     
+    __slots__ = ('base_dir', 'audit_logger', '_cmd_cache')
+    
     def __init__(self, base_dir: Path, audit_logger: AuditLogger):
         self.base_dir = base_dir
         self.audit_logger = audit_logger
-        self.human_loop = HumanInTheLoop()
+        self._cmd_cache: Dict[str, List[str]] = {}
+    
+    @staticmethod
+    def backoff_delay(attempt: int) -> float:
+        """Capped exponential backoff with full jitter, so parallel tasks don't retry in lockstep"""
+        return random.uniform(0, min(RETRY_MAX_DELAY, RETRY_DELAY * (2 ** (attempt - 1))))
     
     def run_script(self, script_path: str, args: List[str] = None, 
-                   timeout: int = 300, task_id: str = "unknown") -> Tuple[bool, str, int]:
+                   timeout: int = 300, task_id: str = "unknown",
+                   input_data: Optional[str] = None) -> Tuple[bool, str, int]:
         """
         Run a script with retry logic and error logging
         
+        input_data, if given, is sent to the script on stdin
+        
         Returns: (success, output, retry_count)
         """
         retries = 0
@@ -291,18 +447,23 @@ class ScriptRunner:
             try:
                 # Human-in-the-loop check for sensitive scripts
                 if 'login' in script_path.lower() or 'poster' in script_path.lower():
-                    if not self.human_loop.confirm("script_execution", f"Running: {script_path}"):
+                    if not HumanInTheLoop.confirm("script_execution", f"Running: {script_path}"):
                         self.audit_logger.log_human_decision(task_id, "script_execution", False)
                         return False, "Human denied execution", 0
                 
-                cmd = ['python', script_path]
-                if args:
-                    cmd.extend(args)
+                # Prebuilt per-script prefix; sys.executable skips the PATH
+                # lookup and always matches the running interpreter
+                prefix = self._cmd_cache.get(script_path)
+                if prefix is None:
+                    prefix = self._cmd_cache[script_path] = [sys.executable, '-u', script_path]
+                cmd = prefix + args if args else prefix
                 
-                logger.info(f"Running script: {' '.join(cmd)}")
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("Running script: %s", ' '.join(cmd))
                 
                 result = subprocess.run(
                     cmd,
+                    input=input_data,
                     capture_output=True,
                     text=True,
                     timeout=timeout,
@@ -317,27 +478,27 @@ class ScriptRunner:
                     return True, output, retries
                 
                 last_error = f"Script exited with code {result.returncode}"
-                logger.warning(f"Script failed (attempt {retries + 1}/{MAX_RETRIES}): {last_error}")
+                logger.warning("Script failed (attempt %d/%d): %s", retries + 1, MAX_RETRIES, last_error)
                 self.audit_logger.log_error(task_id, last_error, retries + 1, MAX_RETRIES)
                 
             except subprocess.TimeoutExpired:
                 last_error = "Script timed out"
-                logger.warning(f"Script timeout (attempt {retries + 1}/{MAX_RETRIES})")
+                logger.warning("Script timeout (attempt %d/%d)", retries + 1, MAX_RETRIES)
                 self.audit_logger.log_error(task_id, last_error, retries + 1, MAX_RETRIES)
             
             except Exception as e:
                 last_error = str(e)
-                logger.error(f"Script error (attempt {retries + 1}/{MAX_RETRIES}): {last_error}")
+                logger.error("Script error (attempt %d/%d): %s", retries + 1, MAX_RETRIES, last_error)
                 self.audit_logger.log_error(task_id, last_error, retries + 1, MAX_RETRIES)
             
             retries += 1
             if retries < MAX_RETRIES:
-                delay = RETRY_DELAY * (2 ** (retries - 1))  # Exponential backoff
-                logger.info(f"Retrying in {delay} seconds...")
+                delay = self.backoff_delay(retries)
+                logger.info("Retrying in %.1f seconds...", delay)
                 time.sleep(delay)
         
         # All retries exhausted - graceful skip
-        logger.info(f"Gracefully skipping task {task_id} after {MAX_RETRIES} failed attempts")
+        logger.info("Gracefully skipping task %s after %d failed attempts", task_id, MAX_RETRIES)
         return False, last_error, retries # type: ignore
 
 
@@ -348,22 +509,31 @@ class RalphWiggumLoop:
     
     Agent Skill: Strong Ralph Wiggum Loop
     - Tracks iterations with full audit logging
-    - Logs each attempt to Audit_Log.md
+    - Records each attempt and logs the history to Audit_Log.md once, on completion/failure
     - Provides detailed failure analysis
     """
     
+    __slots__ = ('max_iterations', 'current_iteration', 'task_status', 'audit_logger', 'task_id',
+                 '_iteration_log')
+    
     def __init__(self, max_iterations: int = RALPH_WIGGUM_MAX_ITERATIONS, audit_logger: AuditLogger = None):
         self.max_iterations = max_iterations
         self.current_iteration = 0
         self.task_status = TaskStatus.PENDING
         self.audit_logger = audit_logger
         self.task_id = None
+        self._iteration_log: List[Tuple[int, str]] = []
+    
+    def _history(self) -> str:
+        """Iteration history as 'n@HH:MM:SS' entries"""
+        return "; ".join(f"{n}@{ts}" for n, ts in self._iteration_log)
     
     def start(self, task_id: str = None):
         """Start the loop with task tracking"""
         self.current_iteration = 0
         self.task_status = TaskStatus.IN_PROGRESS
         self.task_id = task_id
+        self._iteration_log = []
         logger.info("🍩 Ralph Wiggum Loop started - 'I'm gonna try real hard!'")
         if self.audit_logger and task_id:
             self.audit_logger.log("RALPH_WIGGUM_START", f"Task: {task_id}, Max iterations: {self.max_iterations}")
@@ -377,15 +547,15 @@ class RalphWiggumLoop:
         self.current_iteration += 1
         
         if self.current_iteration >= self.max_iterations:
-            logger.warning(f"🍩 Ralph Wiggum Loop: Max iterations ({self.max_iterations}) reached")
+            logger.warning("🍩 Ralph Wiggum Loop: Max iterations (%d) reached", self.max_iterations)
             self.task_status = TaskStatus.FAILED
-            if self.audit_logger and self.task_id:
-                self.audit_logger.log("RALPH_WIGGUM_MAX", f"Task: {self.task_id}, Iterations: {self.current_iteration}")
             return False
         
-        logger.info(f"🍩 Ralph Wiggum Loop: Iteration {self.current_iteration}/{self.max_iterations} - 'Me gonna try again!'")
-        if self.audit_logger and self.task_id:
-            self.audit_logger.log("RALPH_WIGGUM_ITERATION", f"Task: {self.task_id}, Iteration: {self.current_iteration}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("🍩 Ralph Wiggum Loop: Iteration %d/%d - 'Me gonna try again!'",
+                        self.current_iteration, self.max_iterations)
+        # Recorded in memory; written once by complete()/fail()
+        self._iteration_log.append((self.current_iteration, datetime.now().strftime('%H:%M:%S')))
         return True
     
     def complete(self):
@@ -393,20 +563,24 @@ class RalphWiggumLoop:
         self.task_status = TaskStatus.COMPLETE
         logger.info("🍩 Ralph Wiggum Loop: TASK_COMPLETE - 'I did it!'")
         if self.audit_logger and self.task_id:
-            self.audit_logger.log("RALPH_WIGGUM_COMPLETE", f"Task: {self.task_id}, Iterations: {self.current_iteration}", "SUCCESS")
+            self.audit_logger.log("RALPH_WIGGUM_COMPLETE",
+                                  f"Task: {self.task_id}, Iterations: {self.current_iteration}, "
+                                  f"History: {self._history()}", "SUCCESS")
     
     def fail(self, reason: str = ""):
         """Mark task as failed"""
         self.task_status = TaskStatus.FAILED
-        logger.error(f"🍩 Ralph Wiggum Loop: TASK_FAILED - 'Me fail?' Reason: {reason}")
+        logger.error("🍩 Ralph Wiggum Loop: TASK_FAILED - 'Me fail?' Reason: %s", reason)
         if self.audit_logger and self.task_id:
-            self.audit_logger.log("RALPH_WIGGUM_FAIL", f"Task: {self.task_id}, Reason: {reason}", "FAILED")
+            self.audit_logger.log("RALPH_WIGGUM_FAIL",
+                                  f"Task: {self.task_id}, Reason: {reason}, Iterations: {self.current_iteration}, "
+                                  f"History: {self._history()}", "FAILED")
     
     def is_complete(self) -> bool:
-        return self.task_status == TaskStatus.COMPLETE
+        return self.task_status is TaskStatus.COMPLETE
     
     def is_failed(self) -> bool:
-        return self.task_status == TaskStatus.FAILED
+        return self.task_status is TaskStatus.FAILED
 
 
 class AIOrchestrator:
@@ -422,31 +596,32 @@ class AIOrchestrator:
     - Strong Ralph Wiggum loop
     """
     
+    # Constant answer, computed once instead of per message
+    IS_BATCH_POST_SENSITIVE = HumanInTheLoop.is_sensitive('batch_post')
+    
     def __init__(self):
         self.base_dir = BASE_DIR
         self.audit_logger = AuditLogger(AUDIT_LOG)
         self.classifier = MessageClassifier()
         self.script_runner = ScriptRunner(self.base_dir, self.audit_logger)
-        self.ralph_loop = RalphWiggumLoop(audit_logger=self.audit_logger)
-        self.human_loop = HumanInTheLoop()
         
         # Script mappings
-        self.personal_scripts = {
-            'gmail': str(self.base_dir / 'Watchers' / 'gmail_watcher.py'),
-            'whatsapp': str(self.base_dir / 'WhatsApp' / 'whatsapp_watcher.py'),
-        }
+        self.personal_scripts = PERSONAL_SCRIPTS
+        self.business_scripts = BUSINESS_SCRIPTS
         
-        self.business_scripts = {
-            'linkedin': str(self.base_dir / 'LinkedIn' / 'linkedin_watcher.py'),
-            'facebook': str(self.base_dir / 'Watchers' / 'facebook_watcher.py'),
-            'instagram': str(self.base_dir / 'Watchers' / 'instagram_watcher.py'),
-            'twitter': str(self.base_dir / 'Watchers' / 'twitter_watcher.py'),
-            'x': str(self.base_dir / 'Watchers' / 'twitter_watcher.py'),
-        }
+        # Flat (domain, script) tuples for the routing scan
+        self._personal_entries = tuple(self.personal_scripts.items())
+        self._business_entries = tuple(self.business_scripts.items())
+        
+        # Repeated sources route identically - cache the decisions
+        self._route_source = functools.lru_cache(maxsize=256)(self._route_source)
+        self._script_for_source = functools.lru_cache(maxsize=128)(self._script_for_source)
         
         # Metrics
         self.tasks_processed = 0
         self.errors = 0
+        self._metrics_lock = threading.Lock()
+        self._task_ids = itertools.count(1)
 
         # Folders
         self.done_dir = self.base_dir / "Done"
@@ -459,7 +634,7 @@ class AIOrchestrator:
         """Update file status to done and move to Done folder"""
         filepath = message.get('_file')
         if not filepath:
-            logger.warning(f"No filepath found for message: {message.get('id')}")
+            logger.warning("No filepath found for message: %s", message.get('id'))
             return
 
         try:
@@ -468,7 +643,6 @@ class AIOrchestrator:
                 content = f.read()
 
             # Update status in frontmatter
-            import re
             # Replace status: pending with status: done
             content = re.sub(r'^status:\s*pending\s*$', 'status: done', content, flags=re.MULTILINE)
             
@@ -497,48 +671,56 @@ class AIOrchestrator:
             # Delete old file
             os.remove(filepath)
 
-            logger.info(f"✅ Task marked complete: {filename} → Done/")
+            logger.info("✅ Task marked complete: %s → Done/", filename)
             self.audit_logger.log("TASK_MOVED_TO_DONE", f"File: {filename}")
 
         except Exception as e:
-            logger.error(f"Error marking task completed: {e}")
+            logger.error("Error marking task completed: %s", e)
     
     def read_inbox(self) -> List[Dict]:
         """Read messages from inbox directory"""
         messages = []
 
-        if not INBOX_DIR.exists():
-            logger.warning(f"Inbox directory not found: {INBOX_DIR}")
+        # Single directory pass for both .md and .json files
+        md_files = []
+        json_files = []
+        try:
+            with os.scandir(INBOX_PATH) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if name.endswith('.md'):
+                        md_files.append(entry.path)
+                    elif name.endswith('.json'):
+                        json_files.append(entry.path)
+        except FileNotFoundError:
+            logger.warning("Inbox directory not found: %s", INBOX_DIR)
             return messages
 
-        # Read both .md and .json files
-        for msg_file in INBOX_DIR.glob('*.md'):
+        for msg_file in md_files:
             try:
                 with open(msg_file, 'r') as f:
                     content = f.read()
                     # Parse markdown file to extract metadata
-                    message = self._parse_markdown_file(content, str(msg_file))
+                    message = self._parse_markdown_file(content, msg_file)
                     messages.append(message)
             except Exception as e:
-                logger.error(f"Error reading {msg_file}: {e}")
+                logger.error("Error reading %s: %s", msg_file, e)
 
         # Also check for .json files (backward compatibility)
-        for msg_file in INBOX_DIR.glob('*.json'):
+        for msg_file in json_files:
             try:
-                with open(msg_file, 'r') as f:
-                    message = json.load(f)
-                    message['_file'] = str(msg_file)
+                with open(msg_file, 'rb') as f:
+                    message = json_loads(f.read())
+                    message['_file'] = msg_file
                     messages.append(message)
             except Exception as e:
-                logger.error(f"Error reading {msg_file}: {e}")
+                logger.error("Error reading %s: %s", msg_file, e)
 
-        logger.info(f"Read {len(messages)} messages from inbox")
+        logger.info("Read %d messages from inbox", len(messages))
         return messages
 
     def _parse_markdown_file(self, content: str, filepath: str) -> Dict:
         """Parse markdown file to extract message data"""
-        import re
-        
         message = {
             '_file': filepath,
             'source': 'unknown',
@@ -578,17 +760,19 @@ class AIOrchestrator:
     
     def get_script_for_message(self, message: Dict, msg_type: MessageType) -> Optional[str]:
         """Get the appropriate script for a message"""
-        source = message.get('source', '').lower()
-        
-        if msg_type == MessageType.PERSONAL:
-            for domain, script in self.personal_scripts.items():
+        return self._script_for_source(message.get('source', '').lower(), msg_type)
+    
+    def _script_for_source(self, source: str, msg_type: MessageType) -> Optional[str]:
+        """Pick the script for a (lowercased) source and type (LRU cached per instance)"""
+        if msg_type is MessageType.PERSONAL:
+            for domain, script in self._personal_entries:
                 if domain in source:
                     return script
             # Default to WhatsApp for personal
             return self.personal_scripts.get('whatsapp')
         
-        elif msg_type == MessageType.BUSINESS:
-            for domain, script in self.business_scripts.items():
+        elif msg_type is MessageType.BUSINESS:
+            for domain, script in self._business_entries:
                 if domain in source:
                     return script
             # Default to LinkedIn for business
@@ -596,62 +780,97 @@ class AIOrchestrator:
         
         return None
     
+    def _route_source(self, source: str) -> Tuple[MessageType, Optional[str]]:
+        """Classify by source and pick the script in one step (LRU cached per instance)"""
+        msg_type = self.classifier.classify_source(source)
+        return msg_type, self._script_for_source(source, msg_type)
+    
+    def route_message(self, message: Dict) -> Tuple[MessageType, Optional[str]]:
+        """Classify a message and pick its script"""
+        msg_type, script_path = self._route_source(message.get('source', '').lower())
+        if msg_type is MessageType.UNKNOWN:
+            # Source gave no hint - fall back to keyword classification
+            msg_type = self.classifier.classify_keywords(message)
+            script_path = self.get_script_for_message(message, msg_type)
+        return msg_type, script_path
+    
+    def _record_result(self, success: bool):
+        """Update metrics (thread-safe)"""
+        with self._metrics_lock:
+            if success:
+                self.tasks_processed += 1
+            else:
+                self.errors += 1
+    
+    def _task_id(self, message: Dict) -> str:
+        """Stable id for audit logs: message id, else inbox file name, else a unique counter"""
+        if message.get('id'):
+            return str(message['id'])
+        if message.get('_file'):
+            return Path(message['_file']).stem
+        with self._metrics_lock:
+            return f"task_{next(self._task_ids)}"
+    
     def process_message(self, message: Dict) -> bool:
         """Process a single message through the Ralph Wiggum Loop"""
-        task_id = message.get('id', f"task_{self.tasks_processed}")
+        task_id = self._task_id(message)
         
         # Human-in-the-loop for batch operations
-        if self.human_loop.is_sensitive('batch_post') and not AUTO_CONFIRM:
-            if not self.human_loop.confirm('process_message', f"Processing message: {task_id}"):
+        if not AUTO_CONFIRM and self.IS_BATCH_POST_SENSITIVE:
+            if not HumanInTheLoop.confirm('process_message', f"Processing message: {task_id}"):
                 self.audit_logger.log_human_decision(task_id, 'process_message', False)
-                self.errors += 1
+                self._record_result(False)
                 return False
         
-        # Classify message
-        msg_type = self.classifier.classify(message)
-        logger.info(f"Message {task_id} classified as: {msg_type.value}")
-        self.audit_logger.log("MESSAGE_CLASSIFIED", f"Task: {task_id}, Type: {msg_type.value}")
-        
-        # Get appropriate script
-        script_path = self.get_script_for_message(message, msg_type)
+        # Classify message and get appropriate script
+        msg_type, script_path = self.route_message(message)
+        type_value = msg_type.value
+        logger.info("Message %s classified as: %s", task_id, type_value)
+        self.audit_logger.log("MESSAGE_CLASSIFIED", f"Task: {task_id}, Type: {type_value}")
         
         if not script_path:
-            logger.error(f"No script found for message {task_id}")
+            logger.error("No script found for message %s", task_id)
             self.audit_logger.log_task(task_id, "CLASSIFY", "unknown", "FAILED", 
                                       "No matching script found")
-            self.errors += 1
+            self._record_result(False)
             return False
         
         # Determine domain
-        domain = "personal" if msg_type == MessageType.PERSONAL else "business"
+        domain = "personal" if msg_type is MessageType.PERSONAL else "business"
+        
+        # Serialize once for every iteration; sent on stdin ("--message -")
+        # so large messages are not limited by command-line length
+        payload = json_dumps(message)
         
-        # Start Ralph Wiggum Loop with task tracking
-        self.ralph_loop.start(task_id)
+        # Start Ralph Wiggum Loop with task tracking (one loop per task)
+        ralph_loop = RalphWiggumLoop(audit_logger=self.audit_logger)
+        ralph_loop.start(task_id)
         
-        while self.ralph_loop.next_iteration():
+        while ralph_loop.next_iteration():
             # Run the script
             success, output, retries = self.script_runner.run_script(
                 script_path,
-                args=['--message', json.dumps(message)],
-                task_id=task_id
+                args=['--message', '-'],
+                task_id=task_id,
+                input_data=payload
             )
             
             if success:
-                self.ralph_loop.complete()
+                ralph_loop.complete()
                 self.audit_logger.log_task(task_id, "PROCESS", domain, "SUCCESS",
                                           f"Script: {script_path}, Retries: {retries}")
                 # Update file status to done and move to Done folder
                 self._mark_task_completed(message)
-                self.tasks_processed += 1
+                self._record_result(True)
                 return True
             
-            logger.warning(f"Iteration {self.ralph_loop.current_iteration} failed")
+            logger.warning("Iteration %d failed", ralph_loop.current_iteration)
         
         # Ralph Wiggum Loop exhausted - graceful skip
-        self.ralph_loop.fail(f"Max iterations exhausted for {task_id}")
+        ralph_loop.fail(f"Max iterations exhausted for {task_id}")
         self.audit_logger.log_task(task_id, "PROCESS", domain, "FAILED",
-                                  f"Ralph Wiggum Loop exhausted after {self.ralph_loop.current_iteration} iterations - gracefully skipped")
-        self.errors += 1
+                                  f"Ralph Wiggum Loop exhausted after {ralph_loop.current_iteration} iterations - gracefully skipped")
+        self._record_result(False)
         return False
     
     def run(self) -> Dict:
@@ -659,7 +878,8 @@ class AIOrchestrator:
         logger.info("🚀 Starting Gold Tier AI Orchestrator")
         
         # Check weekly audit
-        if self.audit_logger.check_weekly_audit():
+        weekly_due = self.audit_logger.check_weekly_audit()
+        if weekly_due:
             logger.info("📊 Weekly audit triggered")
         
         # Read inbox
@@ -667,11 +887,14 @@ class AIOrchestrator:
         
         if not messages:
             logger.info("No messages to process")
+            self.audit_logger.close()
             return {"processed": 0, "errors": 0, "success_rate": 100.0}
         
-        # Process each message
-        for message in messages:
-            self.process_message(message)
+        # Messages are independent and mostly wait on subprocesses - run them
+        # concurrently, unless a human has to answer confirmation prompts
+        max_workers = min(MAX_PARALLEL_TASKS, len(messages)) if AUTO_CONFIRM else 1
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(self.process_message, messages))
         
         # Calculate metrics
         total = self.tasks_processed + self.errors
@@ -683,16 +906,17 @@ class AIOrchestrator:
             "success_rate": success_rate
         }
         
-        logger.info(f"✅ Orchestration complete: {result}")
+        logger.info("✅ Orchestration complete: %s", result)
         
         # Log weekly audit summary if triggered
-        if self.audit_logger.check_weekly_audit():
+        if weekly_due:
             self.audit_logger.weekly_audit_summary(
                 self.tasks_processed,
                 self.errors,
                 success_rate
             )
         
+        self.audit_logger.close()
         return result
     
     def run_single_task(self, task: Dict) -> bool:
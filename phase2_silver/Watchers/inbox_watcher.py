@@ -10,6 +10,8 @@ import time
 import logging
 import json
 import re
+import queue
+import threading
 from pathlib import Path
 from watchdog.observers import Observer # type: ignore
 from watchdog.events import FileSystemEventHandler # type: ignore
@@ -33,6 +35,9 @@ logging.basicConfig(
     datefmt='%Y-%m-%d %H:%M:%S'
 )
 
+# Maximum number of pending file events held between the observer and the worker
+EVENT_QUEUE_SIZE = 4096
+
 class InboxHandler(FileSystemEventHandler):
     """Handles filesystem events for the Inbox directory."""
 
@@ -40,8 +45,38 @@ class InboxHandler(FileSystemEventHandler):
         self.inbox_path = Path(inbox_path).resolve()
         self.processed_files = {}  # Track files to prevent duplicate processing
         self.mcp_server_url = os.getenv('MCP_SERVER_URL', 'http://localhost:3000')
+        self._lock = threading.Lock()  # Guards processed_files and _pending
+        self._pending = set()  # Paths queued or being processed
+        self._queue = queue.Queue(maxsize=EVENT_QUEUE_SIZE)
+        threading.Thread(target=self._worker, daemon=True).start()
         logging.info(f"Watching directory: {self.inbox_path}")
 
+    def _worker(self):
+        """Drain queued file events off the observer thread."""
+        while True:
+            src_path = self._queue.get()
+            try:
+                self._process_new_file(Path(src_path))
+            finally:
+                with self._lock:
+                    self._pending.discard(src_path)
+                self._queue.task_done()
+
+    def _is_duplicate(self, file_path, file_hash, current_time):
+        """Record the file's hash and report whether it was seen within 5 seconds."""
+        with self._lock:
+            # Clean up old entries (older than 60 seconds) to prevent memory buildup
+            self._cleanup_old_entries(current_time)
+
+            if file_path.name in self.processed_files:
+                old_hash, old_time = self.processed_files[file_path.name]
+                if file_hash == old_hash and (current_time - old_time) < 5:
+                    return True
+
+            # Store the file's hash and timestamp
+            self.processed_files[file_path.name] = (file_hash, current_time)
+            return False
+
     def _get_file_hash(self, file_path):
         """Calculate SHA256 hash of file contents to identify unique files."""
         try:
@@ -189,50 +224,58 @@ class InboxHandler(FileSystemEventHandler):
             self._log_reasoning_step(f"Error in reasoning workflow: {str(e)}", file_path)
             logging.error(f"Error processing {file_path.name}: {e}")
 
-    def on_created(self, event):
-        """Called when a file or directory is created."""
-        if event.is_directory:
-            return
+    def _process_new_file(self, file_path):
+        """Deduplicate a newly created task file and run the reasoning workflow."""
+        current_time = time.time()
 
-        file_path = Path(event.src_path)
+        # Check if file is being written to (not fully written yet)
+        try:
+            # Check if file exists and get its size
+            if file_path.exists() and file_path.stat().st_size == 0:
+                logging.debug(f"File {file_path.name} is empty, likely still being written")
+                return
 
-        # Only process Markdown files
-        if file_path.suffix.lower() == '.md':
-            # Clean up old entries (older than 60 seconds) to prevent memory buildup
-            current_time = time.time()
-            self._cleanup_old_entries(current_time)
+            # Calculate file hash to detect if it was already processed recently
+            file_hash = self._get_file_hash(file_path)
 
-            # Check if file is being written to (not fully written yet)
-            try:
-                # Check if file exists and get its size
-                if file_path.exists() and file_path.stat().st_size == 0:
-                    logging.debug(f"File {file_path.name} is empty, likely still being written")
-                    return
+            if self._is_duplicate(file_path, file_hash, current_time):
+                logging.debug(f"Duplicate event for file: {file_path.name}")
+                return
 
-                # Calculate file hash to detect if it was already processed recently
-                file_hash = self._get_file_hash(file_path)
+            logging.info(f"New task detected: {file_path.name}")
+            print(f"[TASK DETECTED] {file_path.name}")
 
-                # Check if we've seen this file recently (within 5 seconds)
-                if file_path.name in self.processed_files:
-                    old_hash, old_time = self.processed_files[file_path.name]
-                    if file_hash == old_hash and (current_time - old_time) < 5:
-                        logging.debug(f"Duplicate event for file: {file_path.name}")
-                        return
+            # Trigger reasoning workflow for Silver Tier
+            self._trigger_reasoning_workflow(file_path)
 
-                # Store the file's hash and timestamp
-                self.processed_files[file_path.name] = (file_hash, current_time)
+        except (OSError, IOError) as e:
+            self._log_reasoning_step(f"Error accessing file: {str(e)}", file_path)
+            logging.warning(f"Error accessing file {file_path.name}: {e}")
 
-                logging.info(f"New task detected: {file_path.name}")
-                print(f"[TASK DETECTED] {file_path.name}")
+    def on_created(self, event):
+        """Called when a file or directory is created."""
+        if event.is_directory:
+            return
 
-                # Trigger reasoning workflow for Silver Tier
-                self._trigger_reasoning_workflow(file_path)
+        src_path = event.src_path
 
-            except (OSError, IOError) as e:
-                self._log_reasoning_step(f"Error accessing file: {str(e)}", file_path)
-                logging.warning(f"Error accessing file {file_path.name}: {e}")
-        else:
-            logging.debug(f"Non-Markdown file ignored: {file_path.name}")
+        # Only process Markdown files; the worker thread does the rest
+        if not src_path.lower().endswith('.md'):
+            logging.debug(f"Non-Markdown file ignored: {os.path.basename(src_path)}")
+            return
+
+        with self._lock:
+            if src_path in self._pending:
+                logging.debug(f"Event already queued for file: {os.path.basename(src_path)}")
+                return
+            self._pending.add(src_path)
+
+        try:
+            self._queue.put_nowait(src_path)
+        except queue.Full:
+            with self._lock:
+                self._pending.discard(src_path)
+            logging.warning(f"Event queue full, dropping: {os.path.basename(src_path)}")
 
     def on_modified(self, event):
         """Called when a file or directory is modified."""
@@ -243,23 +286,21 @@ class InboxHandler(FileSystemEventHandler):
 
         # Only process Markdown files
         if file_path.suffix.lower() == '.md':
-            # Clean up old entries (older than 60 seconds) to prevent memory buildup
+            # A queued creation will record the hash itself; recording it here
+            # first would make the worker treat the new task as a duplicate
+            with self._lock:
+                if event.src_path in self._pending:
+                    return
+
             current_time = time.time()
-            self._cleanup_old_entries(current_time)
 
             try:
                 # Calculate file hash to detect if it was already processed recently
                 file_hash = self._get_file_hash(file_path)
 
-                # Check if we've seen this file recently (within 5 seconds)
-                if file_path.name in self.processed_files:
-                    old_hash, old_time = self.processed_files[file_path.name]
-                    if file_hash == old_hash and (current_time - old_time) < 5:
-                        logging.debug(f"Duplicate modified event for file: {file_path.name}")
-                        return
-
-                # Store the file's hash and timestamp
-                self.processed_files[file_path.name] = (file_hash, current_time)
+                if self._is_duplicate(file_path, file_hash, current_time):
+                    logging.debug(f"Duplicate modified event for file: {file_path.name}")
+                    return
 
                 logging.debug(f"Task modified: {file_path.name}")
             except (OSError, IOError) as e:
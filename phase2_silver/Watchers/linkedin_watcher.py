@@ -15,12 +15,15 @@ Usage:
 
 import os
 import sys
+import json
 import time
 import logging
+from collections import OrderedDict
+from hashlib import blake2b
 from pathlib import Path
 from datetime import datetime
 from dotenv import load_dotenv
-from playwright.sync_api import sync_playwright, Page, BrowserContext
+from playwright.sync_api import sync_playwright, Page, BrowserContext, TimeoutError as PlaywrightTimeout
 
 # Load environment variables
 load_dotenv()
@@ -28,6 +31,8 @@ load_dotenv()
 # Configuration
 BASE_DIR = Path(__file__).parent
 SESSION_DIR = BASE_DIR / "linkedin_session"
+SEEN_FILE = SESSION_DIR / "seen.json"
+LAST_URL_FILE = SESSION_DIR / "last.json"
 INBOX_DIR = BASE_DIR / "Inbox"
 LOGS_DIR = BASE_DIR / "Logs"
 
@@ -46,7 +51,11 @@ PAGE_LOAD_TIMEOUT = 60000
 ACTION_TIMEOUT = 30000
 LOGIN_TIMEOUT = 120  # seconds for manual login
 
-# Setup logging
+# Dedup memory
+SEEN_CAP = 50_000  # most recent item ids kept in seen_items
+
+# Setup logging (the log directory must exist before the FileHandler opens)
+LOGS_DIR.mkdir(parents=True, exist_ok=True)
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
@@ -58,12 +67,72 @@ logging.basicConfig(
 logger = logging.getLogger('LinkedInWatcher')
 
 
+def _sid(*parts: str) -> str:
+    """Stable 64-bit id for an item (built-in hash() is salted per process)"""
+    h = blake2b(digest_size=8)
+    for part in parts:
+        h.update(part.encode('utf-8', 'ignore'))
+    return h.hexdigest()
+
+
 class LinkedInWatcher:
     """Monitor LinkedIn notifications and messages"""
 
     def __init__(self, page: Page):
         self.page = page
-        self.seen_items = set()
+        self.seen_items = self._load_seen()
+
+    def _load_seen(self) -> OrderedDict:
+        """Load ids seen by previous runs so a restart does not re-save them"""
+        try:
+            with open(SEEN_FILE, 'r', encoding='utf-8') as f:
+                return OrderedDict.fromkeys(json.load(f)[-SEEN_CAP:])
+        except (OSError, ValueError):
+            return OrderedDict()
+
+    def _mark_seen(self, item_id: str) -> bool:
+        """Record item_id in the bounded LRU; returns True if it was not seen before"""
+        if item_id in self.seen_items:
+            self.seen_items.move_to_end(item_id)
+            return False
+        self.seen_items[item_id] = None
+        if len(self.seen_items) > SEEN_CAP:
+            self.seen_items.popitem(last=False)
+        return True
+
+    def save_seen(self):
+        """Persist seen ids (oldest first) for the next run"""
+        try:
+            with open(SEEN_FILE, 'w', encoding='utf-8') as f:
+                json.dump(list(self.seen_items), f)
+        except OSError as e:
+            logger.error(f"Could not save seen items: {e}")
+
+    def save_last_url(self):
+        """Remember where this run ended so the next start can resume there"""
+        try:
+            with open(LAST_URL_FILE, 'w', encoding='utf-8') as f:
+                json.dump({'url': self.page.url}, f)
+        except Exception as e:
+            logger.debug(f"Could not save last URL: {e}")
+
+    def _resume_session(self) -> bool:
+        """Reopen the last page of the previous run; True if the profile is still logged in"""
+        try:
+            with open(LAST_URL_FILE, 'r', encoding='utf-8') as f:
+                last_url = json.load(f).get('url', '')
+        except (OSError, ValueError):
+            return False
+
+        if not last_url.startswith("https://www.linkedin.com") or "login" in last_url:
+            return False
+
+        try:
+            self.page.goto(last_url, timeout=PAGE_LOAD_TIMEOUT, wait_until='domcontentloaded')
+            return self._is_logged_in()
+        except Exception as e:
+            logger.debug(f"Could not resume {last_url}: {e}")
+            return False
 
     def login(self, email: str, password: str, quick_check: bool = False, force_manual: bool = False) -> bool:
         """Login to LinkedIn"""
@@ -73,6 +142,12 @@ class LinkedInWatcher:
         max_retries = 3
         retry_delay = 10
 
+        # A still-valid persistent profile skips the login page entirely
+        if not quick_check and not force_manual and self._resume_session():
+            logger.info("✅ Resumed previous LinkedIn session")
+            print("✅ Already logged in!")
+            return True
+
         for attempt in range(1, max_retries + 1):
             try:
                 if quick_check:
@@ -124,8 +199,12 @@ class LinkedInWatcher:
                         self.page.fill('#username', email)
                         self.page.fill('#password', password)
                         self.page.click('button[type="submit"]')
-                        time.sleep(5)
-                        self.page.wait_for_load_state('networkidle', timeout=PAGE_LOAD_TIMEOUT)
+                        # LinkedIn keeps long-poll connections open, so networkidle rarely fires;
+                        # wait for the DOM and then the nav bar icons
+                        self.page.wait_for_load_state('domcontentloaded', timeout=15000)
+                        self.page.locator(
+                            'div[data-testid="MessagingIcon"], div[data-testid="NotificationsIcon"], img[data-testid="MeDropdown"]'
+                        ).first.wait_for(timeout=PAGE_LOAD_TIMEOUT)
                     except Exception as e:
                         logger.debug(f"Auto-login issue: {e}")
 
@@ -194,14 +273,23 @@ class LinkedInWatcher:
         except:
             return False
 
+    def _settle(self, selector: str, timeout: int = 15000):
+        """Wait for the DOM and then for selector, instead of a fixed sleep"""
+        self.page.wait_for_load_state('domcontentloaded')
+        try:
+            self.page.wait_for_selector(selector, timeout=timeout, state='attached')
+        except PlaywrightTimeout:
+            pass
+
     def check_notifications(self) -> list:
         """Check LinkedIn notifications"""
         logger.info("Checking LinkedIn notifications...")
         notifications = []
+        timestamp = datetime.now().isoformat()  # one instant for the whole check
 
         try:
-            self.page.goto(LINKEDIN_NOTIFICATIONS_URL, timeout=PAGE_LOAD_TIMEOUT)
-            time.sleep(5)
+            self.page.goto(LINKEDIN_NOTIFICATIONS_URL, timeout=PAGE_LOAD_TIMEOUT, wait_until='domcontentloaded')
+            self._settle('div.notification-item')
 
             # Find notifications
             notifs = self.page.locator('div.notification-item').all()
@@ -209,11 +297,9 @@ class LinkedInWatcher:
             for notif in notifs[:15]:
                 try:
                     content = notif.inner_text()
-                    notif_id = f"li_notif_{hash(content)}"
-                    timestamp = datetime.now().isoformat()
+                    notif_id = f"li_notif_{_sid(content)}"
 
-                    if notif_id not in self.seen_items:
-                        self.seen_items.add(notif_id)
+                    if self._mark_seen(notif_id):
                         notifications.append({
                             'id': notif_id,
                             'source': 'linkedin',
@@ -236,10 +322,11 @@ class LinkedInWatcher:
         """Check LinkedIn messages"""
         logger.info("Checking LinkedIn messages...")
         messages = []
+        timestamp = datetime.now().isoformat()  # one instant for the whole check
 
         try:
-            self.page.goto(LINKEDIN_MESSAGING_URL, timeout=PAGE_LOAD_TIMEOUT)
-            time.sleep(5)
+            self.page.goto(LINKEDIN_MESSAGING_URL, timeout=PAGE_LOAD_TIMEOUT, wait_until='domcontentloaded')
+            self._settle('div.conversation-card')
 
             # Find conversations
             convos = self.page.locator('div.conversation-card').all()
@@ -252,11 +339,9 @@ class LinkedInWatcher:
                     preview_elem = convo.locator('div.entity-result__subtitle-line').first
                     preview = preview_elem.inner_text() if preview_elem else ""
 
-                    msg_id = f"li_msg_{hash(name + preview)}"
-                    timestamp = datetime.now().isoformat()
+                    msg_id = f"li_msg_{_sid(name, preview)}"
 
-                    if msg_id not in self.seen_items:
-                        self.seen_items.add(msg_id)
+                    if self._mark_seen(msg_id):
                         messages.append({
                             'id': msg_id,
                             'source': 'linkedin',
@@ -278,41 +363,44 @@ class LinkedInWatcher:
 
 
 def save_to_inbox(items: list) -> list:
-    """Save items to Inbox directory"""
-    INBOX_DIR.mkdir(parents=True, exist_ok=True)
-    saved_files = []
+    """Save items to Inbox directory (created once in main)"""
+    if not items:
+        return []
 
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    filename = f"new_linkedin_{timestamp}.md"
+    now = datetime.now()
+    filename = f"new_linkedin_{now.strftime('%Y%m%d_%H%M%S')}.md"
     filepath = INBOX_DIR / filename
 
-    if not items:
-        return saved_files
+    # Build the whole document first so it goes out in a single write
+    parts = [
+        "# LinkedIn Activity\n\n",
+        f"## Retrieved: {now.isoformat()}\n\n",
+        "---\n\n",
+    ]
 
-    with open(filepath, 'w') as f:
-        f.write(f"# LinkedIn Activity\n\n")
-        f.write(f"## Retrieved: {datetime.now().isoformat()}\n\n")
-        f.write("---\n\n")
+    for item in items:
+        parts.append(
+            f"### {item['id']}\n\n"
+            f"- **Source**: {item['source']}\n"
+            f"- **Type**: {item['type']}\n"
+            f"- **Timestamp**: {item['timestamp']}\n"
+        )
 
-        for item in items:
-            f.write(f"### {item['id']}\n\n")
-            f.write(f"- **Source**: {item['source']}\n")
-            f.write(f"- **Type**: {item['type']}\n")
-            f.write(f"- **Timestamp**: {item['timestamp']}\n")
+        if 'sender' in item:
+            parts.append(f"- **Sender**: {item['sender']}\n")
+        if 'preview' in item:
+            parts.append(f"- **Preview**: {item['preview']}\n")
+        if 'content' in item:
+            parts.append(f"- **Content**: {item['content']}\n")
 
-            if 'sender' in item:
-                f.write(f"- **Sender**: {item['sender']}\n")
-            if 'preview' in item:
-                f.write(f"- **Preview**: {item['preview']}\n")
-            if 'content' in item:
-                f.write(f"- **Content**: {item['content']}\n")
+        parts.append("\n---\n\n")
 
-            f.write("\n---\n\n")
+    with open(filepath, 'w', encoding='utf-8') as f:
+        f.write("".join(parts))
 
-    saved_files.append(str(filepath))
     logger.info(f"Saved {len(items)} items to {filepath}")
 
-    return saved_files
+    return [str(filepath)]
 
 
 def main():
@@ -333,10 +421,9 @@ def main():
                        help='Force fresh login')
     args = parser.parse_args()
 
-    # Ensure directories exist
+    # Ensure directories exist (Logs is created at import)
     SESSION_DIR.mkdir(parents=True, exist_ok=True)
     INBOX_DIR.mkdir(parents=True, exist_ok=True)
-    LOGS_DIR.mkdir(parents=True, exist_ok=True)
 
     total_items = 0
 
@@ -379,8 +466,9 @@ def main():
                 if args.once:
                     watcher.login("", "", quick_check=True)
 
-            # Main loop
+            # Main loop (fixed cadence: each poll starts args.interval after the previous one)
             iteration = 0
+            deadline = time.perf_counter()
             while True:
                 iteration += 1
                 logger.info(f"\n📊 Polling iteration #{iteration}")
@@ -409,12 +497,20 @@ def main():
                     time.sleep(60)
                     break
 
-                print(f"⏳ Waiting {args.interval}s for next poll...")
-                time.sleep(args.interval)
+                deadline += args.interval
+                slack = deadline - time.perf_counter()
+                if slack > 0:
+                    print(f"⏳ Waiting {slack:.0f}s for next poll...")
+                    time.sleep(slack)
+                else:
+                    logger.warning("Poll overran the interval by %.1fs", -slack)
+                    deadline = time.perf_counter()
 
         except KeyboardInterrupt:
             print("\n\n👋 Stopping watcher...")
         finally:
+            watcher.save_seen()
+            watcher.save_last_url()
             context.close()
 
     print("\n" + "=" * 60)
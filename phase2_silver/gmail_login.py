@@ -15,11 +15,26 @@ if sys.platform == 'win32':
     sys.stderr = codecs.getwriter('utf-8')(sys.stderr.buffer, 'strict')
 
 from playwright.sync_api import sync_playwright
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 
 SESSION_DIR = "./gmail_session"
 STORAGE_FILE = os.path.join(SESSION_DIR, "storage_state.json")
 USER_DATA_DIR = os.path.join(SESSION_DIR, "chrome_user_data")
 
+LOGIN_TIMEOUT_MS = 120000
+
+# Resolves as soon as the inbox appears: a MutationObserver reacts to DOM changes
+# instead of polling is_visible() once a second
+INBOX_READY_JS = """() => new Promise(resolve => {
+    const ready = () => location.href.startsWith("https://mail.google.com") ||
+        document.querySelector("[aria-label='Inbox'], [role='main']");
+    if (ready()) return resolve(true);
+    const obs = new MutationObserver(() => {
+        if (ready()) { obs.disconnect(); resolve(true); }
+    });
+    obs.observe(document, {childList: true, subtree: true});
+})"""
+
 os.makedirs(SESSION_DIR, exist_ok=True)
 os.makedirs(USER_DATA_DIR, exist_ok=True)
 
@@ -74,21 +89,14 @@ with sync_playwright() as p:
     # Wait up to 120 seconds for inbox to appear
     print("Waiting for login... (max 120 seconds)")
     logged_in = False
-    for i in range(120):
-        try:
-            # Check for inbox elements
-            if page.is_visible("[aria-label='Inbox']", timeout=1000) or \
-               page.is_visible("[role='main']", timeout=1000) or \
-               page.url.startswith("https://mail.google.com"):
-                print("✅ Inbox detected!")
-                logged_in = True
-                time.sleep(5)  # Wait a bit more for full load
-                break
-        except:
-            pass
-        time.sleep(1)
-        if i % 10 == 9:
-            print(f"  ... waiting ({i+1}s)")
+    try:
+        # Re-evaluated in each new document as the sign-in flow navigates
+        page.wait_for_function(INBOX_READY_JS, timeout=LOGIN_TIMEOUT_MS)
+        print("✅ Inbox detected!")
+        logged_in = True
+        time.sleep(5)  # Wait a bit more for full load
+    except PlaywrightTimeoutError:
+        print("⚠️ Inbox not detected within 120 seconds")
 
     # Save session
     storage = browser.storage_state()
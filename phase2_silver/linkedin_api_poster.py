@@ -307,11 +307,15 @@ def get_post_content(file_path: Path = None) -> str:
 
     # Try Post_Ideas.md
     if POST_IDEAS_FILE.exists():
+        # Stream until the first '---' separator instead of reading the whole file
+        lines = []
         with open(POST_IDEAS_FILE, 'r', encoding='utf-8') as f:
-            content = f.read().strip()
-            posts = content.split('---')
-            if posts:
-                return posts[0].strip()[:3000]
+            for line in f:
+                head, sep, _ = line.partition('---')
+                lines.append(head)
+                if sep:
+                    break
+        return "".join(lines).strip()[:3000]
 
     # Default test content
     return f"🚀 Test post from AI Employee - LinkedIn API Automation\n\nPosted at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n#Automation #AI #LinkedIn"
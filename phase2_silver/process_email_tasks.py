@@ -10,8 +10,8 @@ Usage:
 - py process_email_tasks.py email_*.md         # Move specific file
 """
 
+import os
 import sys
-import shutil
 from pathlib import Path
 from datetime import datetime
 
@@ -19,30 +19,37 @@ BASE_DIR = Path(__file__).parent
 NEED_ACTION_DIR = BASE_DIR / "Need_Action"
 DONE_DIR = BASE_DIR / "Done"
 
+# Plain string forms of the folders, built once for the move hot path
+NEED_ACTION_PATH = str(NEED_ACTION_DIR)
+DONE_PATH = str(DONE_DIR)
+
 def ensure_done_folder():
     """Ensure Done folder exists."""
     DONE_DIR.mkdir(parents=True, exist_ok=True)
 
 def move_to_done(filename: str) -> bool:
     """Move a task file from Need_Action to Done."""
-    src = NEED_ACTION_DIR / filename
-    dst = DONE_DIR / filename
+    src = f"{NEED_ACTION_PATH}/{filename}"
+    dst = f"{DONE_PATH}/{filename}"
 
-    if not src.exists():
+    try:
+        with open(src, 'r', encoding='utf-8') as f:
+            content = f.read()
+    except FileNotFoundError:
         print(f"❌ File not found: {src}")
         return False
 
     # Add completion timestamp to file
-    content = src.read_text(encoding='utf-8')
     if "## Status" in content:
         # Update status to Completed
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         content = content.replace("## Status\nPending", f"## Status\n✅ Completed at {timestamp}")
         content += f"\n\n## Moved to Done\n{timestamp}"
-        dst.write_text(content, encoding='utf-8')
-        src.unlink()  # Delete original
+        with open(dst, 'w', encoding='utf-8') as f:
+            f.write(content)
+        os.remove(src)  # Delete original
     else:
-        shutil.move(str(src), str(dst))
+        os.replace(src, dst)
 
     print(f"✅ Moved: {filename} → Done/")
     return True
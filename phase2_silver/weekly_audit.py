@@ -26,6 +26,7 @@ Usage:
 """
 
 import os
+import re
 import sys
 import json
 import time
@@ -56,6 +57,16 @@ MAX_RETRIES = 3
 RETRY_DELAY = 2
 MAX_ANALYSIS_ITERATIONS = 5
 
+# Content categorization keywords (compiled once; case-insensitive substring match).
+# 'USD'/'PKR' were never matched against the lowercased content, so they are left
+# out to keep the categorization unchanged
+REVENUE_KEYWORDS = ('payment', 'revenue', 'sale', 'income', 'profit', '$')
+BOTTLENECK_KEYWORDS = ('blocked', 'stuck', 'waiting', 'issue', 'error', 'failed', 'problem', 'delay')
+TASK_KEYWORDS = ('task', 'todo', 'action', 'complete', 'done', 'pending', 'review')
+REVENUE_RE = re.compile('|'.join(map(re.escape, REVENUE_KEYWORDS)), re.IGNORECASE)
+BOTTLENECK_RE = re.compile('|'.join(map(re.escape, BOTTLENECK_KEYWORDS)), re.IGNORECASE)
+TASK_RE = re.compile('|'.join(map(re.escape, TASK_KEYWORDS)), re.IGNORECASE)
+
 # Setup logging
 logging.basicConfig(
     level=logging.INFO,
@@ -191,18 +202,14 @@ class VaultReader:
             'other': []
         }
         
-        revenue_keywords = ['payment', 'revenue', 'sale', 'income', 'profit', '$', 'USD', 'PKR']
-        bottleneck_keywords = ['blocked', 'stuck', 'waiting', 'issue', 'error', 'failed', 'problem', 'delay']
-        task_keywords = ['task', 'todo', 'action', 'complete', 'done', 'pending', 'review']
-        
         for item in items:
-            content_lower = item['content'].lower()
+            content = item['content']
             
-            if any(kw in content_lower for kw in revenue_keywords):
+            if REVENUE_RE.search(content):
                 categories['revenue'].append(item)
-            elif any(kw in content_lower for kw in bottleneck_keywords):
+            elif BOTTLENECK_RE.search(content):
                 categories['bottlenecks'].append(item)
-            elif any(kw in content_lower for kw in task_keywords):
+            elif TASK_RE.search(content):
                 categories['tasks'].append(item)
             else:
                 categories['messages'].append(item)
@@ -321,15 +328,13 @@ class WeeklyAuditor:
         
         self.ralph_loop.start()
         
+        # Combine all items for analysis once (no intermediate concatenated lists)
+        all_items = []
+        for key in ('inbox', 'needs_action', 'done'):
+            all_items.extend(self.audit_data[key])
+        
         while self.ralph_loop.next_iteration():
             try:
-                # Combine all items for analysis
-                all_items = (
-                    self.audit_data['inbox'] +
-                    self.audit_data['needs_action'] +
-                    self.audit_data['done']
-                )
-                
                 if not all_items:
                     logger.info("No items to analyze")
                     break
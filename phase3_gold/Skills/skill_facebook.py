@@ -14,27 +14,113 @@ import sys
 import json
 import time
 import random
+from collections import deque
 from datetime import datetime
 from pathlib import Path
 
+try:
+    from PIL import Image
+except ImportError:
+    Image = None  # Pillow is optional; images are uploaded as-is without it
+
+MAX_UPLOAD_SIZE = (1080, 1350)  # largest feed image size; bigger uploads are downscaled first
+
+# Resource types the poster never needs; aborting them speeds up page loads
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font"})
+JITTER_BATCH = 32  # unit jitter samples drawn at once for _human_delay
+
+# Lean Chromium flags: no GPU, extensions, sync or background networking
+CHROMIUM_ARGS = [
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-blink-features=AutomationControlled",
+    "--disable-gpu",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-sync",
+    "--no-first-run",
+    "--disable-features=Translate,BackForwardCache,AcceptCHFrame",
+]
+
 # Add parent directory to path
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
 
 try:
     from playwright.sync_api import sync_playwright
-    from config import FB_EMAIL, FB_PASSWORD
+    from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+    from config import FB_EMAIL, FB_PASSWORD, BROWSER_CDP_ENDPOINT
 except ImportError as e:
     print(f"Import error: {e}")
     print("Make sure .env file exists in phase3_gold folder")
     FB_EMAIL = ""
     FB_PASSWORD = ""
+    BROWSER_CDP_ENDPOINT = ""
+    PlaywrightTimeoutError = TimeoutError
+
+
+# Visibility of each selector, probed in one page round-trip instead of one per selector
+VISIBLE_FLAGS_JS = """(sels) => sels.map(s => {
+    const el = document.querySelector(s);
+    return !!(el && el.getClientRects().length);
+})"""
+
+# First phrase found in the rendered page text, or null
+FIRST_TEXT_JS = """(phrases) => {
+    const text = document.body ? document.body.innerText : '';
+    return phrases.find(p => text.includes(p)) || null;
+}"""
+
+
+def _any_visible(selectors):
+    """Combine fallback selectors into one query matching whichever is visible."""
+    return ", ".join(f"{sel}:visible" for sel in selectors)
 
 
 class FacebookSkill:
     """Facebook posting skill with error recovery and audit logging."""
     
-    def __init__(self):
+    COMPOSER_SELECTORS = (
+        "[placeholder='What\\'s on your mind?']",
+        "[aria-label='What\\'s on your mind?']",
+        "div[role='button']:has-text('What\\'s on your mind?')",
+        "[data-testid='what\\'s on your mind?']",
+        "button:has-text('What\\'s on your mind?')",
+    )
+    TEXT_SELECTORS = (
+        "[data-contents='true']",
+        "[role='textbox']",
+        "div[contenteditable='true']",
+        "[aria-label='What\\'s on your mind?']",
+        "[placeholder*='What\\'s on your mind']",
+    )
+    POST_SELECTORS = (
+        'button:has-text("Post")',
+        'button:has-text("Share")',
+        'button:has-text("Share now")',
+        'button:has-text("Share Now")',
+        '[aria-label="Post"]',
+        '[aria-label="Share"]',
+        '[data-testid="post_button"]',
+        '[data-testid="share_button"]',
+        'button[type="submit"]',
+        'input[type="submit"]',
+        '[value="Post"]',
+        '[value="Share"]',
+    )
+    # Combined once per class: one DOM query/wait instead of one timeout per fallback
+    ANY_COMPOSER = _any_visible(COMPOSER_SELECTORS)
+    ANY_TEXT = _any_visible(TEXT_SELECTORS)
+    ANY_POST = _any_visible(POST_SELECTORS)
+    SUCCESS_INDICATORS = (
+        "Your post was shared",
+        "Posted",
+        "Share now",
+    )
+    
+    def __init__(self, cdp_endpoint=None):
         self.session_dir = "./fb_session"
+        # Attach to an already-running Chromium (remote debugging) instead of launching one
+        self.cdp_endpoint = cdp_endpoint or BROWSER_CDP_ENDPOINT
         self.storage_file = os.path.join(self.session_dir, "storage_state.json")
         self.log_dir = "./Logs"
         self.screenshot_dir = "./Screenshots"
@@ -47,9 +133,9 @@ class FacebookSkill:
         self.post_count = 0
         self.errors = []
         
-        # Use persistent context for better session retention
-        self.user_data_dir = os.path.join(self.session_dir, "chrome_user_data")
-        os.makedirs(self.user_data_dir, exist_ok=True)
+        # Private RNG and pre-sampled jitter so concurrent skills don't share random state
+        self._rng = random.Random()
+        self._jitter = deque()
         
         self._log("FacebookSkill initialized")
         self._log(f"Session dir: {self.session_dir}")
@@ -80,8 +166,9 @@ class FacebookSkill:
     def _take_screenshot(self, page, name):
         """Save screenshot."""
         try:
-            filename = os.path.join(self.screenshot_dir, f"fb_{name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png")
-            page.screenshot(path=filename)
+            # Viewport-only JPEG: feed pages are huge and a lossless full page adds nothing to the audit trail
+            filename = os.path.join(self.screenshot_dir, f"fb_{name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jpg")
+            page.screenshot(path=filename, type='jpeg', quality=70, full_page=False)
             return filename
         except:
             return None
@@ -93,20 +180,63 @@ class FacebookSkill:
                 return json.load(f)
         return None
     
-    def _save_session(self, browser):
+    def _save_session(self, context):
         """Save session."""
         try:
-            storage = browser.storage_state()
+            storage = context.storage_state()
             with open(self.storage_file, 'w') as f:
                 json.dump(storage, f)
             self._log("Session saved to storage_state.json")
-            self._log(f"User data dir: {self.user_data_dir}")
         except Exception as e:
             self._log(f"Session save failed: {e}")
     
     def _human_delay(self, min_ms=800, max_ms=2000):
-        """Human-like delay."""
-        time.sleep(random.uniform(min_ms / 1000, max_ms / 1000))
+        """Human-like delay drawn from the pre-sampled jitter pool."""
+        if not self._jitter:
+            self._jitter.extend(self._rng.random() for _ in range(JITTER_BATCH))
+        time.sleep((min_ms + self._jitter.popleft() * (max_ms - min_ms)) / 1000)
+    
+    def _block_heavy_resources(self, route):
+        """Abort image/media/font requests and let everything else through."""
+        if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+            route.abort()
+        else:
+            route.continue_()
+    
+    def _prep_image(self, image_path):
+        """Downscale a large image to a MAX_UPLOAD_SIZE JPEG before upload (needs Pillow)."""
+        if Image is None:
+            return image_path
+        try:
+            with Image.open(image_path) as im:
+                if im.width <= MAX_UPLOAD_SIZE[0] and im.height <= MAX_UPLOAD_SIZE[1]:
+                    return image_path
+                im = im.convert("RGB")
+                im.thumbnail(MAX_UPLOAD_SIZE)
+                upload_path = os.path.join(self.session_dir, "upload.jpg")
+                im.save(upload_path, "JPEG", quality=85, optimize=True)
+                return upload_path
+        except Exception as e:
+            self._log(f"Image resize skipped: {e}")
+            return image_path
+    
+    def _first_visible(self, page, selectors, combined, timeout=10000):
+        """Wait once for any selector, then return the highest-priority visible match (or None)."""
+        if not self._wait_visible(page, combined, timeout):
+            return None
+        for selector in selectors:
+            candidate = page.locator(selector).first
+            if candidate.is_visible():
+                return candidate
+        return None
+    
+    def _wait_visible(self, page, selector, timeout=10000):
+        """Wait until selector is visible; returns False on timeout instead of raising."""
+        try:
+            page.locator(selector).first.wait_for(state='visible', timeout=timeout)
+            return True
+        except PlaywrightTimeoutError:
+            return False
     
     def post(self, text, image_path=None, max_retries=3):
         """
@@ -122,9 +252,17 @@ class FacebookSkill:
         """
         self._log(f"Starting post: {text[:50]}...")
         
+        # Check and downscale the image once, not on every retry
+        upload_path = None
+        if image_path:
+            if os.path.exists(image_path):
+                upload_path = self._prep_image(image_path)
+            else:
+                self._log(f"Image not found, posting text only: {image_path}")
+        
         for attempt in range(1, max_retries + 1):
             try:
-                result = self._post_internal(text, image_path)
+                result = self._post_internal(text, upload_path)
                 
                 if result["success"]:
                     self.last_post = {
@@ -168,50 +306,77 @@ class FacebookSkill:
         playwright = None
         browser = None
         context = None
+        owned_context = None
         page = None
         
         try:
             with sync_playwright() as playwright:
-                # Use persistent context for better session retention
-                browser = playwright.chromium.launch_persistent_context(
-                    user_data_dir=self.user_data_dir,
-                    headless=False,
-                    slow_mo=800,
-                    args=[
-                        "--no-sandbox",
-                        "--disable-dev-shm-usage",
-                        "--disable-blink-features=AutomationControlled"
-                    ],
-                    viewport={"width": 1280, "height": 720}
-                )
-                
-                page = browser.pages[0] if browser.pages else browser.new_page()
-                
-                # Navigate to Facebook
-                self._log("Navigating to Facebook...")
-                page.goto("https://www.facebook.com", timeout=60000, wait_until="domcontentloaded")
-                self._human_delay(5000, 8000)
-                
-                # Check if logged in
-                if not self._is_logged_in(page):
-                    self._log("Not logged in, attempting login...")
-                    if not self._login(page):
-                        return {"success": False, "error": "Login failed"}
-                    self._human_delay(3000, 5000)
-                
-                self._log("Logged in successfully!")
-                
-                # Save session after login
-                self._save_session(browser)
-                
-                # Create post
-                self._log("Creating post...")
-                if not self._create_post(page, text, image_path):
-                    return {"success": False, "error": "Post creation failed"}
-                
-                self._log("Post completed!")
-                return {"success": True, "text": text, "image": image_path}
-                
+                try:
+                    if self.cdp_endpoint:
+                        # Shared browser: post from a new tab in its default context. That
+                        # context holds the user's own cookies for every site, so the FB
+                        # storage_state is neither loaded nor saved in this mode
+                        shared = playwright.chromium.connect_over_cdp(self.cdp_endpoint)
+                        if shared.contexts:
+                            context = shared.contexts[0]
+                        else:
+                            context = owned_context = shared.new_context(viewport={"width": 1280, "height": 720})
+                        page = context.new_page()
+                        page.route("**/*", self._block_heavy_resources)
+                    else:
+                        # Cookies + localStorage from storage_state.json; no full Chromium profile to load
+                        browser = playwright.chromium.launch(
+                            headless=False,
+                            slow_mo=800,
+                            args=CHROMIUM_ARGS,
+                            ignore_default_args=["--enable-automation"]
+                        )
+                        context = browser.new_context(
+                            storage_state=self._load_session(),
+                            viewport={"width": 1280, "height": 720}
+                        )
+                    
+                        context.route("**/*", self._block_heavy_resources)
+                        page = context.new_page()
+                    
+                    # Navigate to Facebook
+                    self._log("Navigating to Facebook...")
+                    page.goto("https://www.facebook.com", timeout=60000, wait_until="domcontentloaded")
+                    
+                    # Wait for either the feed or the login form instead of a fixed sleep
+                    self._wait_visible(page, "[data-pagelet='MainFeed'], [aria-label='Home'], input[name='email']", timeout=30000)
+                    
+                    # Check the page itself: a saved cookie may have been revoked server-side
+                    if not self._is_logged_in(page):
+                        self._log("Not logged in, attempting login...")
+                        if not self._login(page):
+                            return {"success": False, "error": "Login failed"}
+                    
+                        # Save session after login
+                        if not self.cdp_endpoint:
+                            self._save_session(context)
+                    
+                    self._log("Logged in successfully!")
+                    
+                    # Create post
+                    self._log("Creating post...")
+                    if not self._create_post(page, text, image_path):
+                        return {"success": False, "error": "Post creation failed"}
+                    
+                    self._log("Post completed!")
+                    
+                    # Refresh the saved session so rotated cookies survive to the next run
+                    if not self.cdp_endpoint:
+                        self._save_session(context)
+                    return {"success": True, "text": text, "image": image_path}
+                finally:
+                    # Close our tab (and any context we created) while still connected;
+                    # the shared browser stays up
+                    if self.cdp_endpoint and page:
+                        page.close()
+                    if owned_context:
+                        owned_context.close()
+        
         except Exception as e:
             self._log(f"Post error: {e}")
             if page:
@@ -219,7 +384,9 @@ class FacebookSkill:
             return {"success": False, "error": str(e)}
         finally:
             try:
-                if browser:
+                if context and not self.cdp_endpoint:
+                    context.close()
+                if browser and not self.cdp_endpoint:
                     browser.close()
                 if playwright:
                     playwright.stop()
@@ -234,13 +401,7 @@ class FacebookSkill:
                 "[aria-label='Home']",
                 "[placeholder='What\\'s on your mind?']",
             ]
-            for sel in selectors:
-                try:
-                    if page.is_visible(sel, timeout=5000):
-                        return True
-                except:
-                    continue
-            return False
+            return any(page.evaluate(VISIBLE_FLAGS_JS, selectors))
         except:
             return False
     
@@ -299,34 +460,24 @@ class FacebookSkill:
             self._log("Opening composer...")
             composer_opened = False
             
-            composer_selectors = [
-                "[placeholder='What\\'s on your mind?']",
-                "[aria-label='What\\'s on your mind?']",
-                "div[role='button']:has-text('What\\'s on your mind?')",
-                "[data-testid='what\\'s on your mind?']",
-                "button:has-text('What\\'s on your mind?')",
-            ]
-            
-            for selector in composer_selectors:
-                try:
-                    composer = page.locator(selector).first
-                    composer.wait_for(state='visible', timeout=5000)
+            try:
+                composer = self._first_visible(page, self.COMPOSER_SELECTORS, self.ANY_COMPOSER)
+                if composer:
                     composer.scroll_into_view_if_needed()
-                    self._human_delay(500, 1000)
-                    composer.click()
-                    self._human_delay(2000, 3000)
+                    # click() already hovers and waits for actionability; delay simulates press-hold
+                    composer.click(delay=self._rng.randint(30, 120))
+                    self._wait_visible(page, "div[role='dialog'] [contenteditable='true']")
                     self._log("Composer opened with selector")
                     composer_opened = True
-                    break
-                except:
-                    continue
+            except:
+                pass
             
             # Method 2: Keyboard shortcut if selectors fail
             if not composer_opened:
                 self._log("Trying keyboard shortcut...")
                 try:
                     page.keyboard.press('n')  # Facebook shortcut for new post
-                    self._human_delay(2000, 3000)
+                    self._wait_visible(page, "div[role='dialog'] [contenteditable='true']", timeout=5000)
                     composer_opened = True
                     self._log("Keyboard shortcut worked")
                 except:
@@ -338,7 +489,7 @@ class FacebookSkill:
                     composer = page.get_by_text("What's on your mind?").first
                     composer.wait_for(state='visible', timeout=5000)
                     composer.click()
-                    self._human_delay(2000, 3000)
+                    self._wait_visible(page, "div[role='dialog'] [contenteditable='true']")
                     composer_opened = True
                     self._log("Found by text")
                 except Exception as e:
@@ -350,25 +501,14 @@ class FacebookSkill:
             self._log("Typing text...")
             text_entered = False
             
-            text_selectors = [
-                "[data-contents='true']",
-                "[role='textbox']",
-                "div[contenteditable='true']",
-                "[aria-label='What\\'s on your mind?']",
-                "[placeholder*='What\\'s on your mind']",
-            ]
-            
-            for selector in text_selectors:
-                try:
-                    text_area = page.locator(selector).first
-                    text_area.wait_for(state='visible', timeout=5000)
+            try:
+                text_area = self._first_visible(page, self.TEXT_SELECTORS, self.ANY_TEXT)
+                if text_area:
                     text_area.fill(text)
-                    self._human_delay(1000, 2000)
                     text_entered = True
                     self._log("Text entered")
-                    break
-                except:
-                    continue
+            except:
+                pass
             
             if not text_entered:
                 # Fallback: Use keyboard typing
@@ -380,17 +520,24 @@ class FacebookSkill:
                     self._log(f"Text entry failed: {e}")
                     return False
             
-            # Add image if provided
-            if image_path and os.path.exists(image_path):
+            # Add image if provided (already checked and resized by post())
+            if image_path:
                 self._log(f"Adding image: {image_path}")
                 try:
                     photo_btn = page.locator("[aria-label*='photo'], [data-testid*='photo']").first
-                    photo_btn.click()
-                    self._human_delay(2000, 3000)
+                    try:
+                        # Catch the native file chooser opened by the click
+                        with page.expect_file_chooser(timeout=10000) as fc_info:
+                            photo_btn.click(timeout=5000)  # fail fast to the hidden-input fallback
+                        fc_info.value.set_files(image_path)
+                    except Exception:
+                        # Some layouts only reveal a hidden input instead of opening a chooser
+                        file_input = page.locator('input[type="file"]').first
+                        file_input.wait_for(state='attached', timeout=10000)
+                        file_input.set_input_files(image_path)
                     
-                    file_input = page.locator('input[type="file"]').first
-                    file_input.set_input_files(image_path)
-                    self._human_delay(5000, 8000)
+                    # Wait for the preview thumbnail rather than a fixed upload delay
+                    self._wait_visible(page, "div[role='dialog'] [aria-label*='Remove'], div[role='dialog'] img[src^='blob:']", timeout=30000)
                     self._log("Image uploaded")
                 except Exception as e:
                     self._log(f"Image upload failed: {e}")
@@ -400,40 +547,21 @@ class FacebookSkill:
             post_clicked = False
             
             # Try multiple post button selectors
-            post_selectors = [
-                'button:has-text("Post")',
-                'button:has-text("Share")',
-                'button:has-text("Share now")',
-                'button:has-text("Share Now")',
-                '[aria-label="Post"]',
-                '[aria-label="Share"]',
-                '[data-testid="post_button"]',
-                '[data-testid="share_button"]',
-                'button[type="submit"]',
-                'input[type="submit"]',
-                '[value="Post"]',
-                '[value="Share"]',
-            ]
-            
-            for selector in post_selectors:
-                try:
-                    post_btn = page.locator(selector).first
-                    post_btn.wait_for(state='visible', timeout=3000)
+            try:
+                post_btn = self._first_visible(page, self.POST_SELECTORS, self.ANY_POST)
+                if post_btn:
                     post_btn.scroll_into_view_if_needed()
-                    self._human_delay(300, 500)
-                    post_btn.click()
+                    post_btn.click(delay=self._rng.randint(30, 120))
                     post_clicked = True
-                    self._log(f"Post button clicked: {selector}")
-                    break
-                except:
-                    continue
+                    self._log("Post button clicked")
+            except:
+                pass
             
             # Fallback: Try keyboard Enter
             if not post_clicked:
                 try:
                     self._log("Using Enter key as fallback...")
                     page.keyboard.press('Enter')
-                    self._human_delay(3000, 5000)
                     post_clicked = True
                     self._log("Enter key pressed")
                 except:
@@ -444,28 +572,20 @@ class FacebookSkill:
                 self._take_screenshot(page, "post_button_error")
                 return False
             
-            # Wait for post to submit
+            # Wait for post to submit: the composer editor goes away once the post is sent
             self._log("Waiting for post to publish...")
-            self._human_delay(8000, 12000)
+            try:
+                page.locator("div[role='dialog'] [contenteditable='true']").first.wait_for(state='detached', timeout=60000)
+            except Exception:
+                self._log("Composer still open after 60s")
             
             # Verify post was published
             self._log("Verifying post...")
             try:
                 # Look for success indicators
-                success_indicators = [
-                    "Your post was shared",
-                    "Posted",
-                    "Share now",
-                ]
-                
-                for indicator in success_indicators:
-                    try:
-                        success_msg = page.locator(f'div:has-text("{indicator}")').first
-                        if success_msg.is_visible(timeout=3000):
-                            self._log(f"Post verified: {indicator}")
-                            break
-                    except:
-                        continue
+                indicator = page.evaluate(FIRST_TEXT_JS, list(self.SUCCESS_INDICATORS))
+                if indicator:
+                    self._log(f"Post verified: {indicator}")
                 
                 # Take success screenshot
                 self._take_screenshot(page, "post_success")
@@ -16,6 +16,7 @@ import json
 import time
 import random
 import hashlib
+import xml.etree.ElementTree as ET
 from datetime import datetime
 from pathlib import Path
 
@@ -27,6 +28,27 @@ try:
 except ImportError as e:
     print(f"Import error: {e}")
 
+try:
+    import requests
+except ImportError:
+    requests = None
+
+# Unread mail as an Atom feed: one HTTP request with the session cookies, no inbox render
+GMAIL_FEED_URL = "https://mail.google.com/mail/feed/atom"
+ATOM_NS = {"a": "http://purl.org/atom/ns#"}
+
+# Sender/subject text of the first `limit` inbox rows, read in-page
+EXTRACT_ROWS_JS = """(rows, limit) => rows.slice(0, limit).map(row => {
+    const text = sel => (row.querySelector(sel)?.textContent || '').trim();
+    return {sender: text("[aria-label*=', '], .y6"), subject: text("[aria-label*='Subject'], .y6")};
+})"""
+
+# Visibility of each selector, probed in one page round-trip instead of one per selector
+VISIBLE_FLAGS_JS = """(sels) => sels.map(s => {
+    const el = document.querySelector(s);
+    return !!(el && el.getClientRects().length);
+})"""
+
 
 class GmailSkill:
     """Gmail checking skill with audit logging."""
@@ -45,6 +67,9 @@ class GmailSkill:
         
         self.emails = []
         self.processed_hashes = set()
+        self._feed_digest = None
+        self._http = requests.Session() if requests else None
+        self._cookies_mtime = None
         
         self._log("GmailSkill initialized")
     
@@ -118,7 +143,7 @@ status: pending
             return False
     
     def _human_delay(self, min_ms=800, max_ms=2000):
-        time.sleep(random.uniform(min_ms / 1000, max_ms / 1000))
+        time.sleep((min_ms + (max_ms - min_ms) * random.random()) / 1000)
     
     def check_inbox(self, max_emails=10):
         """
@@ -133,45 +158,20 @@ status: pending
         self._log("Checking Gmail inbox...")
         
         try:
-            with sync_playwright() as p:
-                browser = p.chromium.launch_persistent_context(
-                    user_data_dir=self.user_data_dir,
-                    headless=False,
-                    slow_mo=500,
-                    args=["--no-sandbox", "--disable-dev-shm-usage", "--disable-blink-features=AutomationControlled"],
-                    viewport={"width": 1280, "height": 720}
-                )
-                
-                page = browser.pages[0] if browser.pages else browser.new_page()
-                
-                # Navigate to Gmail
-                self._log("Opening Gmail...")
-                page.goto("https://mail.google.com", timeout=60000, wait_until="domcontentloaded")
-                self._human_delay(5000, 8000)
-                
-                # Check login
-                if not self._is_logged_in(page):
-                    self._log("❌ Not logged in - Run Gmail login first")
-                    browser.close()
+            # Plain HTTP with the saved session cookies; Chromium only when that session is missing or expired
+            emails = self._get_emails_over_http(max_emails)
+            
+            if emails is None:
+                emails = self._check_inbox_browser(max_emails)
+                if emails is None:
                     return {"success": False, "error": "Not logged in"}
-                
-                self._log("✅ Logged in!")
-                
-                # Wait for inbox to load
-                self._log("Waiting for inbox...")
-                self._human_delay(5000, 8000)
-                
-                # Get emails
-                emails = self._get_emails(page, max_emails)
-                
-                # Process emails
-                for email in emails:
-                    if self._save_email(email["subject"], email["sender"], email["body"], email["timestamp"]):
-                        self.emails.append(email)
-                
-                browser.close()
-                
-                self._log(f"Checked inbox: {len(self.emails)} new emails")
+            
+            # Process emails
+            for email in emails:
+                if self._save_email(email["subject"], email["sender"], email["body"], email["timestamp"]):
+                    self.emails.append(email)
+            
+            self._log(f"Checked inbox: {len(self.emails)} new emails")
                 
         except Exception as e:
             self._log(f"Check failed: {e}")
@@ -183,6 +183,126 @@ status: pending
             "emails": self.emails
         }
     
+    def _check_inbox_browser(self, max_emails=10):
+        """Read the inbox through Chromium; returns None if the profile is not logged in."""
+        with sync_playwright() as p:
+            browser = p.chromium.launch_persistent_context(
+                user_data_dir=self.user_data_dir,
+                headless=False,
+                slow_mo=500,
+                args=["--no-sandbox", "--disable-dev-shm-usage", "--disable-blink-features=AutomationControlled"],
+                viewport={"width": 1280, "height": 720}
+            )
+            
+            try:
+                # Read the Atom feed first; only render the inbox UI if it is unavailable
+                emails = self._get_emails_from_feed(browser, max_emails)
+                
+                if emails is None:
+                    page = browser.pages[0] if browser.pages else browser.new_page()
+                    
+                    # Navigate to Gmail
+                    self._log("Opening Gmail...")
+                    page.goto("https://mail.google.com", timeout=60000, wait_until="domcontentloaded")
+                    self._human_delay(5000, 8000)
+                    
+                    # Check login
+                    if not self._is_logged_in(page):
+                        self._log("❌ Not logged in - Run Gmail login first")
+                        return None
+                    
+                    self._log("✅ Logged in!")
+                    
+                    # Wait for inbox to load
+                    self._log("Waiting for inbox...")
+                    self._human_delay(5000, 8000)
+                    
+                    # Get emails
+                    emails = self._get_emails(page, max_emails)
+                
+                # Refresh the cookies the HTTP path uses on the next check
+                browser.storage_state(path=self.storage_file)
+                return emails
+            finally:
+                browser.close()
+    
+    def _get_emails_over_http(self, max_emails=10):
+        """Fetch the Atom feed with requests using cookies from storage_state.json (no browser)."""
+        if requests is None:
+            return None
+        
+        try:
+            mtime = os.path.getmtime(self.storage_file)
+            if mtime != self._cookies_mtime:
+                with open(self.storage_file, 'r') as f:
+                    cookies = json.load(f).get("cookies", [])
+                self._http.cookies.clear()
+                for c in cookies:
+                    self._http.cookies.set(c["name"], c["value"], domain=c.get("domain", ""), path=c.get("path", "/"))
+                self._cookies_mtime = mtime
+            
+            # An expired session answers with a redirect/401 rather than the feed
+            response = self._http.get(GMAIL_FEED_URL, timeout=30, allow_redirects=False)
+        except (OSError, ValueError, requests.RequestException) as e:
+            self._log(f"HTTP feed unavailable ({e}), using browser")
+            return None
+        
+        if response.status_code != 200:
+            self._log(f"HTTP feed unavailable (HTTP {response.status_code}), using browser")
+            return None
+        
+        return self._parse_feed(response.content, max_emails)
+    
+    def _get_emails_from_feed(self, context, max_emails=10):
+        """
+        Get unread emails from Gmail's Atom feed through the browser context.
+        
+        Returns None if the feed can't be read (e.g. not logged in) so the
+        caller falls back to the inbox UI.
+        """
+        try:
+            response = context.request.get(GMAIL_FEED_URL, timeout=30000)
+            if not response.ok:
+                self._log(f"Feed unavailable (HTTP {response.status}), using inbox UI")
+                return None
+            body = response.body()
+        except Exception as e:
+            self._log(f"Feed unavailable ({e}), using inbox UI")
+            return None
+        
+        return self._parse_feed(body, max_emails)
+    
+    def _parse_feed(self, body, max_emails=10):
+        """
+        Parse Atom feed bytes into email dicts.
+        
+        Returns None if the body is not a feed (e.g. a login page), and []
+        if it is unchanged since the last poll.
+        """
+        # Same feed bytes as the last poll: nothing new to parse
+        digest = hashlib.md5(body).hexdigest()
+        if digest == self._feed_digest:
+            return []
+        
+        try:
+            root = ET.fromstring(body)
+        except ET.ParseError:
+            return None
+        self._feed_digest = digest
+        
+        emails = []
+        for entry in root.findall("a:entry", ATOM_NS)[:max_emails]:
+            sender = entry.findtext("a:author/a:email", "", ATOM_NS) or entry.findtext("a:author/a:name", "", ATOM_NS)
+            emails.append({
+                "sender": sender.strip(),
+                "subject": entry.findtext("a:title", "", ATOM_NS).strip(),
+                "body": entry.findtext("a:summary", "", ATOM_NS).strip(),
+                "timestamp": datetime.now()
+            })
+        
+        self._log(f"Feed: {len(emails)} unread emails")
+        return emails
+    
     def _is_logged_in(self, page):
         """Check if logged in."""
         try:
@@ -191,13 +311,7 @@ status: pending
                 "[data-testid='inbox']",
                 "[aria-label='Compose']",
             ]
-            for sel in selectors:
-                try:
-                    if page.is_visible(sel, timeout=5000):
-                        return True
-                except:
-                    continue
-            return False
+            return any(page.evaluate(VISIBLE_FLAGS_JS, selectors))
         except:
             return False
     
@@ -215,35 +329,18 @@ status: pending
             
             for selector in selectors:
                 try:
-                    rows = page.locator(selector).all()
+                    # All rows in one round-trip instead of two text_content calls per row
+                    rows = page.locator(selector).evaluate_all(EXTRACT_ROWS_JS, max_emails)
+                    now = datetime.now()
                     
-                    for row in rows[:max_emails]:
-                        try:
-                            # Get sender
-                            sender = ""
-                            try:
-                                sender_elem = row.locator("[aria-label*=', '], .y6").first
-                                sender = sender_elem.text_content(timeout=2000).strip()
-                            except:
-                                pass
-                            
-                            # Get subject
-                            subject = ""
-                            try:
-                                subject_elem = row.locator("[aria-label*='Subject'], .y6").first
-                                subject = subject_elem.text_content(timeout=2000).strip()
-                            except:
-                                pass
-                            
-                            if sender and subject:
-                                emails.append({
-                                    "sender": sender,
-                                    "subject": subject,
-                                    "body": "",
-                                    "timestamp": datetime.now()
-                                })
-                        except:
-                            continue
+                    for row in rows:
+                        if row["sender"] and row["subject"]:
+                            emails.append({
+                                "sender": row["sender"],
+                                "subject": row["subject"],
+                                "body": "",
+                                "timestamp": now
+                            })
                     
                     if emails:
                         break
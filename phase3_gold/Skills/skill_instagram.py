@@ -14,23 +14,53 @@ import sys
 import json
 import time
 import random
+from collections import deque
 from datetime import datetime
 from pathlib import Path
 
+try:
+    from PIL import Image
+except ImportError:
+    Image = None  # Pillow is optional; images are uploaded as-is without it
+
+MAX_UPLOAD_SIZE = (1080, 1350)  # largest feed image size; bigger uploads are downscaled first
+
+# Resource types the poster never needs; aborting them speeds up page loads
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font"})
+JITTER_BATCH = 32  # unit jitter samples drawn at once for _human_delay
+
+# Lean Chromium flags: no GPU, extensions, sync or background networking
+CHROMIUM_ARGS = [
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-blink-features=AutomationControlled",
+    "--disable-gpu",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-sync",
+    "--no-first-run",
+    "--disable-features=Translate,BackForwardCache,AcceptCHFrame",
+]
+
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 try:
     from playwright.sync_api import sync_playwright
-    from config import IG_USERNAME, IG_PASSWORD
+    from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+    from config import IG_USERNAME, IG_PASSWORD, BROWSER_CDP_ENDPOINT
 except ImportError as e:
     print(f"Import error: {e}")
+    BROWSER_CDP_ENDPOINT = ""
+    PlaywrightTimeoutError = TimeoutError
 
 
 class InstagramSkill:
     """Instagram posting skill with error recovery and audit logging."""
     
-    def __init__(self):
+    def __init__(self, cdp_endpoint=None):
         self.session_dir = "./ig_session"
+        # Attach to an already-running Chromium (remote debugging) instead of launching one
+        self.cdp_endpoint = cdp_endpoint or BROWSER_CDP_ENDPOINT
         self.storage_file = os.path.join(self.session_dir, "storage_state.json")
         self.log_dir = "./Logs"
         self.screenshot_dir = "./Screenshots"
@@ -43,6 +73,10 @@ class InstagramSkill:
         self.post_count = 0
         self.errors = []
         
+        # Private RNG and pre-sampled jitter so concurrent skills don't share random state
+        self._rng = random.Random()
+        self._jitter = deque()
+        
         self._log("InstagramSkill initialized")
     
     def _log(self, message):
@@ -67,8 +101,9 @@ class InstagramSkill:
     
     def _take_screenshot(self, page, name):
         try:
-            filename = os.path.join(self.screenshot_dir, f"ig_{name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png")
-            page.screenshot(path=filename)
+            # Viewport-only JPEG: feed pages are huge and a lossless full page adds nothing to the audit trail
+            filename = os.path.join(self.screenshot_dir, f"ig_{name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jpg")
+            page.screenshot(path=filename, type='jpeg', quality=70, full_page=False)
             return filename
         except:
             return None
@@ -89,7 +124,52 @@ class InstagramSkill:
             self._log(f"Session save failed: {e}")
     
     def _human_delay(self, min_ms=800, max_ms=2000):
-        time.sleep(random.uniform(min_ms / 1000, max_ms / 1000))
+        """Human-like delay drawn from the pre-sampled jitter pool."""
+        if not self._jitter:
+            self._jitter.extend(self._rng.random() for _ in range(JITTER_BATCH))
+        time.sleep((min_ms + self._jitter.popleft() * (max_ms - min_ms)) / 1000)
+    
+    def _block_heavy_resources(self, route):
+        """Abort image/media/font requests and let everything else through."""
+        if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+            route.abort()
+        else:
+            route.continue_()
+    
+    def _prep_image(self, image_path):
+        """Downscale a large image to a MAX_UPLOAD_SIZE JPEG before upload (needs Pillow)."""
+        if Image is None:
+            return image_path
+        try:
+            with Image.open(image_path) as im:
+                if im.width <= MAX_UPLOAD_SIZE[0] and im.height <= MAX_UPLOAD_SIZE[1]:
+                    return image_path
+                im = im.convert("RGB")
+                im.thumbnail(MAX_UPLOAD_SIZE)
+                upload_path = os.path.join(self.session_dir, "upload.jpg")
+                im.save(upload_path, "JPEG", quality=85, optimize=True)
+                return upload_path
+        except Exception as e:
+            self._log(f"Image resize skipped: {e}")
+            return image_path
+    
+    def _dismiss_optional(self, page, selector, timeout=1500):
+        """Click an optional dialog button if it shows up quickly; skip it otherwise."""
+        button = page.locator(selector).first
+        try:
+            button.wait_for(state='visible', timeout=timeout)
+            button.click(timeout=timeout)
+        except PlaywrightTimeoutError:
+            return False
+        return True
+    
+    def _wait_visible(self, page, selector, timeout=10000):
+        """Wait until selector is visible; returns False on timeout instead of raising."""
+        try:
+            page.locator(selector).first.wait_for(state='visible', timeout=timeout)
+            return True
+        except PlaywrightTimeoutError:
+            return False
     
     def post(self, text, image_path=None, max_retries=3):
         """
@@ -108,9 +188,12 @@ class InstagramSkill:
         if not image_path or not os.path.exists(image_path):
             return {"success": False, "error": "Image path required for Instagram"}
         
+        # Downscale once up front rather than on every retry
+        upload_path = self._prep_image(image_path)
+        
         for attempt in range(1, max_retries + 1):
             try:
-                result = self._post_internal(text, image_path)
+                result = self._post_internal(text, upload_path)
                 
                 if result["success"]:
                     self.last_post = {
@@ -149,41 +232,55 @@ class InstagramSkill:
         
         try:
             with sync_playwright() as playwright:
-                browser = playwright.chromium.launch(
-                    headless=False,
-                    slow_mo=800,
-                    args=["--no-sandbox", "--disable-dev-shm-usage", "--disable-blink-features=AutomationControlled"]
-                )
-                
-                storage = self._load_session()
-                
-                context = browser.new_context(
-                    storage_state=storage,
-                    viewport={"width": 1280, "height": 720}
-                )
-                
-                page = context.new_page()
-                
-                # Navigate to Instagram
-                self._log("Navigating to Instagram...")
-                page.goto("https://www.instagram.com/", timeout=60000)
-                self._human_delay(5000, 8000)
-                
-                # Check login
-                if not self._is_logged_in(page):
-                    self._log("Not logged in, attempting login...")
-                    if not self._login(page):
-                        return {"success": False, "error": "Login failed"}
-                
-                self._save_session(context)
-                
-                # Create post
-                self._log("Creating post...")
-                if not self._create_post(page, text, image_path):
-                    return {"success": False, "error": "Post creation failed"}
-                
-                return {"success": True, "text": text, "image": image_path}
-                
+                try:
+                    if self.cdp_endpoint:
+                        browser = playwright.chromium.connect_over_cdp(self.cdp_endpoint)
+                    else:
+                        browser = playwright.chromium.launch(
+                            headless=False,
+                            slow_mo=800,
+                            args=CHROMIUM_ARGS,
+                            ignore_default_args=["--enable-automation"]
+                        )
+                    
+                    storage = self._load_session()
+                    
+                    context = browser.new_context(
+                        storage_state=storage,
+                        viewport={"width": 1280, "height": 720}
+                    )
+                    
+                    context.route("**/*", self._block_heavy_resources)
+                    page = context.new_page()
+                    
+                    # Navigate to Instagram
+                    self._log("Navigating to Instagram...")
+                    page.goto("https://www.instagram.com/", timeout=60000)
+                    
+                    # Wait for either the feed or the login form instead of a fixed sleep
+                    self._wait_visible(page, "article[role='article'], [role='feed'], input[name='username']", timeout=30000)
+                    
+                    # Check the page itself: a saved cookie may have been revoked server-side
+                    if not self._is_logged_in(page):
+                        self._log("Not logged in, attempting login...")
+                        if not self._login(page):
+                            return {"success": False, "error": "Login failed"}
+                        self._save_session(context)
+                    
+                    # Create post
+                    self._log("Creating post...")
+                    if not self._create_post(page, text, image_path):
+                        return {"success": False, "error": "Post creation failed"}
+                    
+                    # Refresh the saved session so rotated cookies survive to the next run
+                    if not self.cdp_endpoint:
+                        self._save_session(context)
+                    return {"success": True, "text": text, "image": image_path}
+                finally:
+                    # Close our context while still connected; a shared browser stays up
+                    if self.cdp_endpoint and context:
+                        context.close()
+        
         except Exception as e:
             self._log(f"Post error: {e}")
             if page:
@@ -191,8 +288,8 @@ class InstagramSkill:
             return {"success": False, "error": str(e)}
         finally:
             try:
-                if context: context.close()
-                if browser: browser.close()
+                if context and not self.cdp_endpoint: context.close()
+                if browser and not self.cdp_endpoint: browser.close()
                 if playwright: playwright.stop()
             except:
                 pass
@@ -248,22 +345,12 @@ class InstagramSkill:
                 self._human_delay(8000, 12000)
             
             # Handle "Save login" popup
-            try:
-                save_btn = page.locator("button:has-text('Save'), button:has-text('Not Now')").first
-                if save_btn.is_visible(timeout=3000):
-                    save_btn.click()
-                    self._human_delay(1000, 2000)
-            except:
-                pass
+            if self._dismiss_optional(page, "button:has-text('Save'), button:has-text('Not Now')"):
+                self._human_delay(1000, 2000)
             
             # Handle notifications popup
-            try:
-                notif_btn = page.locator("button:has-text('Not Now'), button:has-text('Allow')").first
-                if notif_btn.is_visible(timeout=3000):
-                    notif_btn.click()
-                    self._human_delay(1000, 2000)
-            except:
-                pass
+            if self._dismiss_optional(page, "button:has-text('Not Now'), button:has-text('Allow')"):
+                self._human_delay(1000, 2000)
             
             self._log("Login completed")
             return True
@@ -280,7 +367,6 @@ class InstagramSkill:
             try:
                 create_btn = page.locator("[aria-label='New post'], [aria-label='Create'], div[role='button']:has-text('New')").first
                 create_btn.click()
-                self._human_delay(3000, 5000)
             except Exception as e:
                 self._log(f"Create button failed: {e}")
                 self._take_screenshot(page, "create_button_error")
@@ -289,11 +375,15 @@ class InstagramSkill:
             # Upload image
             self._log(f"Uploading image: {image_path}")
             try:
-                self._human_delay(2000, 3000)
-                file_input = page.locator('input[type="file"]').first
-                file_input.wait_for(state='attached', timeout=10000)
-                file_input.set_input_files(image_path)
-                self._human_delay(5000, 8000)
+                try:
+                    select_btn = page.locator("button:has-text('Select from computer')").first
+                    with page.expect_file_chooser(timeout=10000) as fc_info:
+                        select_btn.click(timeout=5000)  # fail fast to the hidden-input fallback
+                    fc_info.value.set_files(image_path)
+                except Exception:
+                    file_input = page.locator('input[type="file"]').first
+                    file_input.wait_for(state='attached', timeout=10000)
+                    file_input.set_input_files(image_path)
             except Exception as e:
                 self._log(f"Image upload failed: {e}")
                 self._take_screenshot(page, "upload_error")
@@ -303,18 +393,20 @@ class InstagramSkill:
             self._log("Clicking Next (crop)...")
             try:
                 next_btn = page.locator('button:has-text("Next"), div[role="button"]:has-text("Next")').first
+                next_btn.wait_for(state='visible', timeout=30000)
                 next_btn.click()
-                self._human_delay(3000, 5000)
             except Exception as e:
                 self._log(f"Next button failed: {e}")
                 return False
             
-            # Click Next (filters) - if visible
+            # Click Next (filters) - if visible. The crop step's Next stays on
+            # screen during the transition, so wait for the edit step's
+            # Filters/Adjustments tabs before looking for the second Next
             try:
+                self._wait_visible(page, "div[role='dialog'] >> text=/^(Filters|Adjustments)$/", timeout=10000)
                 next_btn2 = page.locator('button:has-text("Next")').first
-                if next_btn2.is_visible(timeout=3000):
+                if self._wait_visible(page, 'button:has-text("Next")', timeout=3000):
                     next_btn2.click()
-                    self._human_delay(2000, 3000)
             except:
                 pass
             
@@ -323,8 +415,8 @@ class InstagramSkill:
                 self._log("Typing caption...")
                 try:
                     caption_box = page.locator("[aria-label='Write a caption...'], [placeholder='Write a caption...'], textarea").first
+                    caption_box.wait_for(state='visible', timeout=10000)
                     caption_box.fill(text)
-                    self._human_delay(1000, 2000)
                 except Exception as e:
                     self._log(f"Caption failed: {e}")
             
@@ -333,7 +425,9 @@ class InstagramSkill:
             try:
                 share_btn = page.locator('button:has-text("Share"), div[role="button"]:has-text("Share")').first
                 share_btn.click()
-                self._human_delay(8000, 12000)
+                
+                # Wait for Instagram's confirmation instead of a fixed delay
+                self._wait_visible(page, "text=/post has been shared|Post shared/i", timeout=60000)
             except Exception as e:
                 self._log(f"Share button failed: {e}")
                 return False
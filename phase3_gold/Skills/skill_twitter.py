@@ -66,8 +66,9 @@ class TwitterSkill:
     
     def _take_screenshot(self, page, name):
         try:
-            filename = os.path.join(self.screenshot_dir, f"tw_{name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png")
-            page.screenshot(path=filename)
+            # Viewport-only JPEG, matching the FB/IG skills: audit shots only need to show what the bot saw
+            filename = os.path.join(self.screenshot_dir, f"tw_{name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jpg")
+            page.screenshot(path=filename, type='jpeg', quality=60, full_page=False)
             return filename
         except:
             return None
@@ -88,7 +89,7 @@ class TwitterSkill:
             self._log(f"Session save failed: {e}")
     
     def _human_delay(self, min_ms=800, max_ms=2000):
-        time.sleep(random.uniform(min_ms / 1000, max_ms / 1000))
+        time.sleep((min_ms + (max_ms - min_ms) * random.random()) / 1000)
     
     def post(self, text, max_retries=3):
         """
@@ -12,13 +12,33 @@ Usage:
 """
 
 import os
+import re
 import sys
 import json
+import threading
 from datetime import datetime, timedelta
 from pathlib import Path
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+# (report name, log/inbox prefix) for every audited platform
+PLATFORMS = (
+    ("Facebook", "facebook"),
+    ("Instagram", "instagram"),
+    ("Twitter/X", "twitter"),
+    ("WhatsApp", "whatsapp"),
+    ("Gmail", "gmail"),
+)
+SOCIAL_PLATFORMS = ("Facebook", "Instagram", "Twitter/X")
+MESSAGE_PLATFORMS = ("WhatsApp", "Gmail")
+MESSAGE_PREFIXES = frozenset({"whatsapp", "gmail"})
+POST_PREFIXES = frozenset({"facebook", "instagram", "twitter"})
+
+# Log line classifiers (checked in this order, first match wins)
+ERROR_RE = re.compile(r'error', re.I)
+WARNING_RE = re.compile(r'WARN|(?i:warning)')
+SUCCESS_RE = re.compile(r'success', re.I)
+
 
 class WeeklyAuditSkill:
     """Weekly audit and CEO briefing generation skill."""
@@ -28,42 +48,43 @@ class WeeklyAuditSkill:
         self.inbox_dir = "./Inbox"
         self.done_dir = "./Done"
         self.report_dir = "./Reports"
+        self.main_briefing = os.path.normpath(os.path.join(self.log_dir, "..", "CEO_Briefing.md"))
         
         os.makedirs(self.log_dir, exist_ok=True)
         os.makedirs(self.inbox_dir, exist_ok=True)
         os.makedirs(self.done_dir, exist_ok=True)
         os.makedirs(self.report_dir, exist_ok=True)
         
+        # Append handle for the daily audit log, reopened when the date rolls over
+        self._log_lock = threading.Lock()
+        self._log_fp = None
+        self._log_day = None
+        
         self._log("WeeklyAuditSkill initialized")
     
     def _log(self, message):
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        log_entry = f"[{timestamp}] {message}"
+        now = datetime.now()
+        log_entry = f"[{now.strftime('%Y-%m-%d %H:%M:%S')}] {message}"
         print(log_entry)
         
-        log_file = os.path.join(self.log_dir, f"audit_{datetime.now().strftime('%Y%m%d')}.log")
-        with open(log_file, 'a', encoding='utf-8') as f:
-            f.write(log_entry + "\n")
+        day = now.strftime('%Y%m%d')
+        with self._log_lock:
+            if day != self._log_day:
+                if self._log_fp is not None:
+                    self._log_fp.close()
+                log_file = os.path.join(self.log_dir, f"audit_{day}.log")
+                self._log_fp = open(log_file, 'a', encoding='utf-8')
+                self._log_day = day
+            self._log_fp.write(log_entry + "\n")
+            self._log_fp.flush()
     
-    def _get_week_range(self):
+    def _get_week_range(self, now=None):
         """Get current week's date range."""
-        today = datetime.now()
+        today = now or datetime.now()
         start_of_week = today - timedelta(days=today.weekday())
         end_of_week = start_of_week + timedelta(days=6, hours=23, minutes=59, seconds=59)
         return start_of_week, end_of_week
     
-    def _count_files_in_dir(self, directory, prefix=None):
-        """Count files in a directory."""
-        if not os.path.exists(directory):
-            return 0
-        
-        count = 0
-        for f in os.listdir(directory):
-            if prefix and not f.startswith(prefix):
-                continue
-            count += 1
-        return count
-    
     def _parse_log_file(self, filepath):
         """Parse a log file and extract statistics."""
         stats = {
@@ -73,35 +94,37 @@ class WeeklyAuditSkill:
             "success": 0
         }
         
-        if not os.path.exists(filepath):
-            return stats
-        
         try:
             with open(filepath, 'r', encoding='utf-8') as f:
                 for line in f:
                     stats["total_lines"] += 1
-                    if "ERROR" in line or "error" in line.lower():
+                    if ERROR_RE.search(line):
                         stats["errors"] += 1
-                    elif "WARN" in line or "warning" in line.lower():
+                    elif WARNING_RE.search(line):
                         stats["warnings"] += 1
-                    elif "success" in line.lower() or "successful" in line.lower():
+                    elif SUCCESS_RE.search(line):
                         stats["success"] += 1
-        except:
+        except (OSError, UnicodeDecodeError):
             pass
         
         return stats
     
-    def _collect_platform_stats(self, platform):
-        """Collect statistics for a platform."""
+    def _list_dir(self, directory):
+        """List a directory once, treating a missing directory as empty."""
+        try:
+            return os.listdir(directory)
+        except FileNotFoundError:
+            return []
+    
+    def _collect_platform_stats(self, platform, log_names, inbox_names):
+        """Collect statistics for a platform from pre-listed Logs/Inbox names."""
         log_prefix = platform.lower()
-        log_file = os.path.join(self.log_dir, f"{log_prefix}_{datetime.now().strftime('%Y%m%d')}.log")
         
         # Get all log files for this platform
-        platform_logs = []
-        if os.path.exists(self.log_dir):
-            for f in os.listdir(self.log_dir):
-                if f.startswith(log_prefix) and f.endswith('.log'):
-                    platform_logs.append(os.path.join(self.log_dir, f))
+        platform_logs = [
+            os.path.join(self.log_dir, f) for f in log_names
+            if f.startswith(log_prefix) and f.endswith('.log')
+        ]
         
         # Aggregate stats
         total_stats = {
@@ -121,35 +144,42 @@ class WeeklyAuditSkill:
             total_stats["success"] += stats["success"]
         
         # Count posts/messages from inbox
-        if platform.lower() in ["whatsapp", "gmail"]:
-            total_stats["messages"] = self._count_files_in_dir(self.inbox_dir, prefix=platform.lower())
-        elif platform.lower() in ["facebook", "instagram", "twitter"]:
+        if log_prefix in MESSAGE_PREFIXES:
+            total_stats["messages"] = sum(1 for f in inbox_names if f.startswith(log_prefix))
+        elif log_prefix in POST_PREFIXES:
             # Count from audit logs
-            audit_file = os.path.join(self.log_dir, f"{platform.lower()}_audit.jsonl")
-            if os.path.exists(audit_file):
-                with open(audit_file, 'r') as f:
-                    total_stats["posts"] = sum(1 for line in f if '"success": true' in line)
+            audit_name = f"{log_prefix}_audit.jsonl"
+            if audit_name in log_names:
+                audit_file = os.path.join(self.log_dir, audit_name)
+                # Binary read: only a byte marker is needed, so skip text decoding
+                with open(audit_file, 'rb') as f:
+                    total_stats["posts"] = sum(1 for line in f if b'"success": true' in line)
         
         return total_stats
     
-    def generate_weekly_report(self):
+    def generate_weekly_report(self, now=None):
         """
         Generate weekly business audit report.
         
+        Args:
+            now: Timestamp for the report (defaults to the current time)
+        
         Returns:
             dict: Weekly report data
         """
         self._log("Generating weekly audit report...")
         
-        start_of_week, end_of_week = self._get_week_range()
+        now = now or datetime.now()
+        start_of_week, end_of_week = self._get_week_range(now)
+        
+        # List Logs and Inbox once for all platforms
+        log_names = set(self._list_dir(self.log_dir))
+        inbox_names = self._list_dir(self.inbox_dir)
         
         # Collect stats from all platforms
         platforms = {
-            "Facebook": self._collect_platform_stats("Facebook"),
-            "Instagram": self._collect_platform_stats("Instagram"),
-            "Twitter/X": self._collect_platform_stats("Twitter"),
-            "WhatsApp": self._collect_platform_stats("WhatsApp"),
-            "Gmail": self._collect_platform_stats("Gmail"),
+            name: self._collect_platform_stats(prefix, log_names, inbox_names)
+            for name, prefix in PLATFORMS
         }
         
         # Calculate totals
@@ -161,7 +191,7 @@ class WeeklyAuditSkill:
         # Generate report
         report = {
             "report_type": "Weekly Business Audit",
-            "generated_at": datetime.now().isoformat(),
+            "generated_at": now.isoformat(),
             "week_start": start_of_week.strftime("%Y-%m-%d"),
             "week_end": end_of_week.strftime("%Y-%m-%d"),
             "summary": {
@@ -175,28 +205,34 @@ class WeeklyAuditSkill:
         }
         
         # Save report
-        self._save_report(report, "weekly_audit")
+        self._save_report(report, "weekly_audit", now)
         
         self._log(f"Weekly report generated: {total_posts} posts, {total_messages} messages")
         
         return report
     
-    def generate_ceo_briefing(self):
+    def generate_ceo_briefing(self, now=None):
         """
         Generate CEO briefing document.
         
+        Args:
+            now: Timestamp for the briefing (defaults to the current time)
+        
         Returns:
             str: Path to briefing document
         """
         self._log("Generating CEO briefing...")
         
         # Get weekly report
-        weekly_report = self.generate_weekly_report()
+        now = now or datetime.now()
+        weekly_report = self.generate_weekly_report(now)
         
         # Generate briefing content
-        briefing = f"""# CEO Weekly Briefing
+        summary = weekly_report['summary']
+        platforms = weekly_report['platforms']
+        parts = [f"""# CEO Weekly Briefing
 
-**Generated:** {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
+**Generated:** {now.strftime("%Y-%m-%d %H:%M:%S")}
 **Period:** {weekly_report['week_start']} to {weekly_report['week_end']}
 
 ---
@@ -205,9 +241,9 @@ class WeeklyAuditSkill:
 
 | Metric | Value |
 |--------|-------|
-| Total Social Posts | {weekly_report['summary']['total_posts']} |
-| Total Messages | {weekly_report['summary']['total_messages']} |
-| System Errors | {weekly_report['summary']['total_errors']} |
+| Total Social Posts | {summary['total_posts']} |
+| Total Messages | {summary['total_messages']} |
+| System Errors | {summary['total_errors']} |
 | Health Score | {weekly_report['health_score']}/100 |
 
 ---
@@ -217,29 +253,28 @@ class WeeklyAuditSkill:
 ### Social Media
 | Platform | Posts | Errors | Status |
 |----------|-------|--------|--------|
-| Facebook | {weekly_report['platforms']['Facebook'].get('posts', 0)} | {weekly_report['platforms']['Facebook'].get('errors', 0)} | {'✅' if weekly_report['platforms']['Facebook'].get('errors', 0) == 0 else '⚠️'} |
-| Instagram | {weekly_report['platforms']['Instagram'].get('posts', 0)} | {weekly_report['platforms']['Instagram'].get('errors', 0)} | {'✅' if weekly_report['platforms']['Instagram'].get('errors', 0) == 0 else '⚠️'} |
-| Twitter/X | {weekly_report['platforms']['Twitter/X'].get('posts', 0)} | {weekly_report['platforms']['Twitter/X'].get('errors', 0)} | {'✅' if weekly_report['platforms']['Twitter/X'].get('errors', 0) == 0 else '⚠️'} |
-
+"""]
+        parts.extend(self._platform_row(name, platforms[name], 'posts') for name in SOCIAL_PLATFORMS)
+        parts.append("""
 ### Communications
 | Platform | Messages | Errors | Status |
 |----------|----------|--------|--------|
-| WhatsApp | {weekly_report['platforms']['WhatsApp'].get('messages', 0)} | {weekly_report['platforms']['WhatsApp'].get('errors', 0)} | {'✅' if weekly_report['platforms']['WhatsApp'].get('errors', 0) == 0 else '⚠️'} |
-| Gmail | {weekly_report['platforms']['Gmail'].get('messages', 0)} | {weekly_report['platforms']['Gmail'].get('errors', 0)} | {'✅' if weekly_report['platforms']['Gmail'].get('errors', 0) == 0 else '⚠️'} |
-
+""")
+        parts.extend(self._platform_row(name, platforms[name], 'messages') for name in MESSAGE_PLATFORMS)
+        parts.append(f"""
 ---
 
 ## Key Highlights
 
 - **Most Active Platform:** {self._get_most_active_platform(weekly_report)}
-- **Total Operations:** {weekly_report['summary']['total_posts'] + weekly_report['summary']['total_messages']}
+- **Total Operations:** {summary['total_posts'] + summary['total_messages']}
 - **Error Rate:** {self._calculate_error_rate(weekly_report):.2f}%
 
 ---
 
 ## Action Items
 
-1. {'✅ All systems operating normally' if weekly_report['summary']['total_errors'] == 0 else f'⚠️ {weekly_report["summary"]["total_errors"]} errors require attention'}
+1. {'✅ All systems operating normally' if summary['total_errors'] == 0 else f'⚠️ {summary["total_errors"]} errors require attention'}
 2. Review message inbox for pending responses
 3. Plan next week's social media content
 
@@ -252,27 +287,37 @@ class WeeklyAuditSkill:
 ---
 
 *Report generated by AI Employee Automation System - Gold Tier*
-"""
+""")
+        data = "".join(parts).encode('utf-8')
         
         # Save briefing
-        filename = f"CEO_Briefing_{datetime.now().strftime('%Y%m%d')}.md"
+        filename = f"CEO_Briefing_{now.strftime('%Y%m%d')}.md"
         filepath = os.path.join(self.report_dir, filename)
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(briefing)
+        self._write_atomic(filepath, data)
         
         # Also update main CEO_Briefing.md
-        main_briefing = os.path.join(self.log_dir, "..", "CEO_Briefing.md")
         try:
-            with open(main_briefing, 'w', encoding='utf-8') as f:
-                f.write(briefing)
-        except:
+            self._write_atomic(self.main_briefing, data)
+        except OSError:
             pass
         
         self._log(f"CEO briefing saved: {filepath}")
         
         return filepath
     
+    def _write_atomic(self, path, data):
+        """Write bytes to a temp file and swap it in, so readers never see a partial file."""
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    
+    def _platform_row(self, name, stats, count_key):
+        """Format one platform row of a briefing table."""
+        errors = stats.get('errors', 0)
+        return f"| {name} | {stats.get(count_key, 0)} | {errors} | {'✅' if errors == 0 else '⚠️'} |\n"
+    
     def _calculate_health_score(self, errors, success):
         """Calculate system health score (0-100)."""
         total = errors + success
@@ -323,9 +368,9 @@ class WeeklyAuditSkill:
         
         return "\n".join(recommendations)
     
-    def _save_report(self, report, report_type):
+    def _save_report(self, report, report_type, now=None):
         """Save report to file."""
-        filename = f"{report_type}_{datetime.now().strftime('%Y%m%d')}.json"
+        filename = f"{report_type}_{(now or datetime.now()).strftime('%Y%m%d')}.json"
         filepath = os.path.join(self.report_dir, filename)
         
         with open(filepath, 'w', encoding='utf-8') as f:
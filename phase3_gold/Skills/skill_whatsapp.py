@@ -19,12 +19,15 @@ from datetime import datetime
 from pathlib import Path
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
 
 try:
     from playwright.sync_api import sync_playwright
 except ImportError as e:
     print(f"Import error: {e}")
 
+from config import SAFE_FILENAME
+
 
 class WhatsAppSkill:
     """WhatsApp message monitoring skill with audit logging."""
@@ -79,7 +82,7 @@ class WhatsAppSkill:
         
         self.processed_hashes.add(msg_hash)
         
-        filename = f"{timestamp.strftime('%Y%m%d_%H%M%S')}_whatsapp_{sender.replace(' ', '_')}.md"
+        filename = f"{timestamp.strftime('%Y%m%d_%H%M%S')}_whatsapp_{sender.translate(SAFE_FILENAME)[:64]}.md"
         filepath = os.path.join(self.inbox_dir, filename)
         
         content = f"""---
@@ -114,7 +117,7 @@ status: pending
             return False
     
     def _human_delay(self, min_ms=800, max_ms=2000):
-        time.sleep(random.uniform(min_ms / 1000, max_ms / 1000))
+        time.sleep((min_ms + (max_ms - min_ms) * random.random()) / 1000)
     
     def start_monitoring(self, duration=3600, check_interval=5):
         """
@@ -12,7 +12,10 @@ from pathlib import Path
 from datetime import datetime
 from playwright.sync_api import sync_playwright
 
-from base_watcher import BaseWatcher, INBOX_DIR, NEEDS_ACTION_DIR
+from base_watcher import BaseWatcher, BASE_DIR, INBOX_DIR, NEEDS_ACTION_DIR
+
+sys.path.insert(0, str(BASE_DIR))
+from config import SAFE_FILENAME
 
 
 class WhatsAppWatcher(BaseWatcher):
@@ -55,7 +58,7 @@ class WhatsAppWatcher(BaseWatcher):
         is_priority = any(kw in text.lower() for kw in self.priority_keywords)
         priority = 'high' if is_priority else 'normal'
         
-        filename = f"WHATSAPP_{sender.replace(' ', '_')}_{timestamp.strftime('%Y%m%d_%H%M%S')}.md"
+        filename = f"WHATSAPP_{sender.translate(SAFE_FILENAME)[:64]}_{timestamp.strftime('%Y%m%d_%H%M%S')}.md"
         filepath = NEEDS_ACTION_DIR / filename
         
         content = f"""---
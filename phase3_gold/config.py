@@ -71,6 +71,20 @@ COMPANY_URN = os.getenv("COMPANY_URN", "")
 MCP_PORT = int(os.getenv("MCP_PORT", "3000"))
 AUDIT_MCP_PORT = int(os.getenv("AUDIT_MCP_PORT", "3001"))
 
+# =============================================================================
+# Browser Configuration
+# =============================================================================
+# CDP endpoint of a long-running Chromium started with --remote-debugging-port,
+# e.g. http://localhost:9222. Empty = each browser skill launches its own.
+BROWSER_CDP_ENDPOINT = os.getenv("BROWSER_CDP_ENDPOINT", "")
+
+# =============================================================================
+# File Naming
+# =============================================================================
+# Translation table for filenames built from sender/contact names: path
+# separators, control characters and the characters Windows reserves
+SAFE_FILENAME = str.maketrans(dict.fromkeys([chr(c) for c in range(32)] + list(' /\\:*?"<>|'), "_"))
+
 # =============================================================================
 # Post Content Configuration
 # =============================================================================
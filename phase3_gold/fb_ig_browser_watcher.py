@@ -28,13 +28,33 @@ except ImportError:
     print("[INFO] Then: playwright install chromium")
     sys.exit(1)
 
-from config import FB_EMAIL, FB_PASSWORD, IG_USERNAME, IG_PASSWORD
+from config import FB_EMAIL, FB_PASSWORD, FB_PAGE_ID, IG_USERNAME, IG_PASSWORD
 
 # Configuration
 CHECK_INTERVAL = 60  # seconds
 INBOX_DIR = "./Inbox"
 SESSION_DIR = "./fb_ig_session"
 LOGS_DIR = "./Logs"
+FB_MESSAGES_URL = f"https://www.facebook.com/{FB_PAGE_ID}/messages/"
+IG_MESSAGES_URL = "https://www.instagram.com/direct/inbox/"
+
+THREAD_LIMIT = 5  # newest threads checked per poll
+# The watcher only reads text; Chromium drops these itself (trailing * covers CDN query strings)
+BLOCKED_URL_PATTERNS = [
+    "*.jpg*", "*.jpeg*", "*.png*", "*.webp*", "*.gif*",
+    "*.mp4*", "*.webm*", "*.woff2*", "*.woff*", "*.ttf*",
+]
+
+# Walks the thread list in-page and returns {count, rows} in a single round-trip;
+# sender and preview are the first two text spans of each row
+EXTRACT_THREADS_JS = """([selector, limit]) => {
+    const threads = document.querySelectorAll(selector);
+    const rows = [...threads].slice(0, limit).map(row => {
+        const spans = row.querySelectorAll('span[dir="auto"]');
+        return {sender: spans[0]?.innerText || '', preview: spans[1]?.innerText || ''};
+    });
+    return {count: threads.length, rows};
+}"""
 
 # Create directories
 os.makedirs(INBOX_DIR, exist_ok=True)
@@ -136,25 +156,43 @@ message_id: {message_id or 'N/A'}
         
         self._log("[BROWSER] Launched with persistent session")
     
+    def _block_heavy_resources(self, page):
+        """Have Chromium drop image/video/font URLs for this tab (no per-request Python callback)."""
+        cdp = self.browser.new_cdp_session(page)
+        cdp.send("Network.enable")
+        cdp.send("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+    
     def close_browser(self):
         """Close browser."""
         if self.browser:
             self.browser.close()
             self._log("[BROWSER] Closed")
     
-    def check_facebook_messages(self):
-        """Check Facebook Page messages."""
+    def _open_page(self, url):
+        """Open url in a new tab, returning as soon as navigation commits."""
+        page = self.browser.new_page()
+        self._block_heavy_resources(page)
+        page.goto(url, timeout=60000, wait_until="commit")
+        return page
+    
+    def _settle(self, page, selector, timeout=15000):
+        """Wait for the DOM and then for selector, instead of a fixed sleep."""
+        page.wait_for_load_state("domcontentloaded", timeout=60000)
+        try:
+            page.wait_for_selector(selector, timeout=timeout, state="attached")
+        except PlaywrightTimeout:
+            pass
+    
+    def check_facebook_messages(self, page=None):
+        """Check Facebook Page messages (page: a tab already navigating to the inbox)."""
         self._log("[FB] Checking messages...")
         
         try:
             # Go to Facebook Page inbox
-            page_url = f"https://www.facebook.com/{FB_PAGE_ID}/messages/"
-            
-            self.page = self.browser.new_page()
-            self.page.goto(page_url, timeout=60000)
+            self.page = page or self._open_page(FB_MESSAGES_URL)
             
-            # Wait for page to load
-            self.page.wait_for_timeout(5000)
+            # Wait for the thread list (or the login form)
+            self._settle(self.page, 'div[role="row"], input[name="email"]')
             
             # Check if logged in
             if "login" in self.page.url.lower():
@@ -164,30 +202,18 @@ message_id: {message_id or 'N/A'}
             # Look for message threads
             try:
                 # Find message threads (selectors may need adjustment)
-                message_threads = self.page.query_selector_all('div[role="row"]')
+                threads = self.page.evaluate(EXTRACT_THREADS_JS, ['div[role="row"]', THREAD_LIMIT])
                 
-                if message_threads:
-                    self._log(f"[FB] Found {len(message_threads)} message threads")
+                if threads["count"]:
+                    self._log(f"[FB] Found {threads['count']} message threads")
                     
                     # Check first few threads for new messages
-                    for thread in message_threads[:5]:
-                        try:
-                            sender_elem = thread.query_selector('span[dir="auto"]')
-                            message_elem = thread.query_selector('span[dir="auto"] + span')
-                            time_elem = thread.query_selector('span[title]')
-                            
-                            if sender_elem and message_elem:
-                                sender = sender_elem.inner_text()
-                                message = message_elem.inner_text()
-                                time_str = time_elem.get_attribute('title') if time_elem else "Unknown"
-                                
-                                # Check if this is a new message
-                                if self.is_new_message(sender, message):
-                                    self._log(f"[FB] New message from {sender}: {message[:50]}...")
-                                    self._save_to_inbox("facebook", sender, message)
-                                    
-                        except Exception as e:
-                            continue  # Skip problematic threads
+                    for row in threads["rows"]:
+                        sender, message = row["sender"], row["preview"]
+                        
+                        if sender and message and self.is_new_message(sender, message):
+                            self._log(f"[FB] New message from {sender}: {message[:50]}...")
+                            self._save_to_inbox("facebook", sender, message)
                 
                 else:
                     self._log("[FB] No message threads found")
@@ -202,19 +228,16 @@ message_id: {message_id or 'N/A'}
             self._log(f"[FB] Error: {e}")
             self.errors += 1
     
-    def check_instagram_messages(self):
-        """Check Instagram Direct messages."""
+    def check_instagram_messages(self, page=None):
+        """Check Instagram Direct messages (page: a tab already navigating to the inbox)."""
         self._log("[IG] Checking messages...")
         
         try:
             # Go to Instagram DM
-            page_url = "https://www.instagram.com/direct/inbox/"
+            self.page = page or self._open_page(IG_MESSAGES_URL)
             
-            self.page = self.browser.new_page()
-            self.page.goto(page_url, timeout=60000)
-            
-            # Wait for page to load
-            self.page.wait_for_timeout(5000)
+            # Wait for the thread list (or the login form)
+            self._settle(self.page, 'div[role="listitem"], input[name="username"]')
             
             # Check if logged in
             if "login" in self.page.url.lower():
@@ -224,27 +247,19 @@ message_id: {message_id or 'N/A'}
             # Look for message threads
             try:
                 # Find message threads
-                message_threads = self.page.query_selector_all('div[role="listitem"]')
+                threads = self.page.evaluate(EXTRACT_THREADS_JS, ['div[role="listitem"]', THREAD_LIMIT])
                 
-                if message_threads:
-                    self._log(f"[IG] Found {len(message_threads)} message threads")
+                if threads["count"]:
+                    self._log(f"[IG] Found {threads['count']} message threads")
                     
-                    # Check first few threads
-                    for thread in message_threads[:5]:
-                        try:
-                            sender_elem = thread.query_selector('span[dir="auto"]')
-                            message_elem = thread.query_selector('span[dir="auto"] + span')
-                            
-                            if sender_elem and message_elem:
-                                sender = sender_elem.inner_text()
-                                message = message_elem.inner_text()
-                                
-                                if self.is_new_message(sender, message):
-                                    self._log(f"[IG] New message from {sender}: {message[:50]}...")
-                                    self._save_to_inbox("instagram", sender, message)
-                                    
-                        except Exception as e:
-                            continue
+                    # Check first few threads for new messages
+                    for row in threads["rows"]:
+                        sender, message = row["sender"], row["preview"]
+                        
+                        if sender and message and self.is_new_message(sender, message):
+                            self._log(f"[IG] New message from {sender}: {message[:50]}...")
+                            self._save_to_inbox("instagram", sender, message)
+                
                 else:
                     self._log("[IG] No message threads found")
                     
@@ -262,7 +277,6 @@ message_id: {message_id or 'N/A'}
         """Login to Facebook."""
         try:
             self.page.goto("https://www.facebook.com/login/", timeout=60000)
-            self.page.wait_for_timeout(3000)
             
             # Fill credentials
             self.page.fill('#email', FB_EMAIL)
@@ -271,9 +285,11 @@ message_id: {message_id or 'N/A'}
             # Click login
             self.page.click('button[type="submit"]')
             
-            # Wait for navigation
-            self.page.wait_for_load_state('networkidle')
-            self.page.wait_for_timeout(5000)
+            # Wait for the home feed; networkidle never settles on FB's long-poll connections
+            try:
+                self.page.locator("[role='feed'], [aria-label='Home'], [aria-label*=\"What's on your mind\"]").first.wait_for(timeout=30000)
+            except Exception:
+                self._log("[FB] Home feed not detected after login")
             
             self._log("[FB] Login attempt complete")
             
@@ -285,7 +301,6 @@ message_id: {message_id or 'N/A'}
         """Login to Instagram."""
         try:
             self.page.goto("https://www.instagram.com/accounts/login/", timeout=60000)
-            self.page.wait_for_timeout(5000)
             
             # Fill credentials
             self.page.fill('input[name="username"]', IG_USERNAME)
@@ -294,9 +309,11 @@ message_id: {message_id or 'N/A'}
             # Click login
             self.page.click('button[type="submit"]')
             
-            # Wait for navigation
-            self.page.wait_for_load_state('networkidle')
-            self.page.wait_for_timeout(5000)
+            # Wait for the home icon or the "Not Now" prompt instead of networkidle
+            try:
+                self.page.locator('svg[aria-label="Home"], button:has-text("Not Now")').first.wait_for(timeout=30000)
+            except Exception:
+                self._log("[IG] Home feed not detected after login")
             
             self._log("[IG] Login attempt complete")
             
@@ -323,14 +340,21 @@ message_id: {message_id or 'N/A'}
         
         try:
             while True:
-                # Check Facebook
-                self.check_facebook_messages()
+                # Start both inbox loads before reading either, so the page loads overlap
+                # (sync Playwright objects can't be shared across worker threads)
+                fb_page = ig_page = None
+                try:
+                    fb_page = self._open_page(FB_MESSAGES_URL)
+                    ig_page = self._open_page(IG_MESSAGES_URL)
+                except Exception as e:
+                    self._log(f"[ERROR] Could not open inbox tabs: {e}")
+                    self.errors += 1
                 
-                # Wait a bit
-                time.sleep(10)
+                # Check Facebook
+                self.check_facebook_messages(fb_page)
                 
                 # Check Instagram
-                self.check_instagram_messages()
+                self.check_instagram_messages(ig_page)
                 
                 # Wait until next check
                 self._log(f"[WAIT] Next check in {CHECK_INTERVAL} seconds...")
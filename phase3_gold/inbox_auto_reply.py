@@ -13,9 +13,9 @@ Usage:
 import os
 import sys
 import time
+import asyncio
 import json
 from datetime import datetime
-from pathlib import Path
 
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -76,6 +76,15 @@ AUTO_REPLIES = {
 POST_KEYWORDS = ["post", "share", "publish", "upload", "facebook", "instagram", "linkedin", "twitter"]
 
 
+def list_inbox_files():
+    """Return paths of .md files in Inbox using a single scandir pass."""
+    try:
+        with os.scandir(INBOX_DIR) as entries:
+            return [entry.path for entry in entries if entry.name.endswith('.md')]
+    except FileNotFoundError:
+        return []
+
+
 class InboxProcessor:
     """Process Inbox messages and send auto-replies."""
     
@@ -84,6 +93,13 @@ class InboxProcessor:
         self.processed_count = 0
         self.error_count = 0
         
+        # Reply channel dispatch table, keyed by message source
+        self.reply_handlers = {
+            'whatsapp': self._reply_whatsapp,
+            'facebook': self._reply_facebook,
+            'instagram': self._reply_instagram,
+        }
+        
     def _log(self, message):
         """Log message with timestamp."""
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -104,34 +120,29 @@ class InboxProcessor:
     def read_inbox_file(self, filepath):
         """Read inbox markdown file."""
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Parse frontmatter
-            lines = content.split('\n')
             metadata = {}
-            message_text = ""
+            body_lines = []
             in_frontmatter = False
             
-            for line in lines:
-                if line.strip() == '---':
-                    if not in_frontmatter:
-                        in_frontmatter = True
-                    else:
-                        in_frontmatter = False
-                    continue
-                
-                if in_frontmatter:
-                    if ':' in line:
-                        key, value = line.split(':', 1)
-                        metadata[key.strip()] = value.strip()
-                else:
-                    if line.startswith('# Message from'):
+            # Parse frontmatter line by line instead of slurping the file
+            with open(filepath, 'r', encoding='utf-8') as f:
+                for line in f:
+                    line = line.rstrip('\n')
+                    if line.strip() == '---':
+                        in_frontmatter = not in_frontmatter
                         continue
-                    if line.strip():
-                        message_text += line + "\n"
+                    
+                    if in_frontmatter:
+                        if ':' in line:
+                            key, value = line.split(':', 1)
+                            metadata[key.strip()] = value.strip()
+                    else:
+                        if line.startswith('# Message from'):
+                            continue
+                        if line.strip():
+                            body_lines.append(line)
             
-            return metadata, message_text.strip()
+            return metadata, "\n".join(body_lines).strip()
             
         except Exception as e:
             self._log(f"[ERROR] Failed to read {filepath}: {e}")
@@ -159,6 +170,21 @@ class InboxProcessor:
         
         return False
     
+    def _reply_whatsapp(self, sender, reply_text):
+        """Send WhatsApp reply."""
+        result = self.watcher.send_whatsapp_message(sender, reply_text)
+        return result.get('success', False)
+    
+    def _reply_facebook(self, sender, reply_text):
+        """Facebook reply would require page messaging API - for now, log it."""
+        self._log(f"[FB] Reply prepared for {sender}")
+        return True
+    
+    def _reply_instagram(self, sender, reply_text):
+        """Instagram reply would require DM API - for now, log it."""
+        self._log(f"[IG] Reply prepared for {sender}")
+        return True
+    
     def send_reply(self, metadata, message_text, reply_text):
         """Send reply via appropriate channel."""
         source = metadata.get('source', 'unknown')
@@ -166,38 +192,29 @@ class InboxProcessor:
         
         self._log(f"[REPLY] Sending to {sender} via {source}")
         
+        handler = self.reply_handlers.get(source)
+        if handler is None:
+            self._log(f"[WARN] Unknown source: {source}")
+            return False
+        
         try:
-            if source == 'whatsapp':
-                # Send WhatsApp reply
-                result = self.watcher.send_whatsapp_message(sender, reply_text)
-                return result.get('success', False)
-                
-            elif source == 'facebook':
-                # Facebook reply would require page messaging API
-                # For now, log it
-                self._log(f"[FB] Reply prepared for {sender}")
-                return True
-                
-            elif source == 'instagram':
-                # Instagram reply would require DM API
-                # For now, log it
-                self._log(f"[IG] Reply prepared for {sender}")
-                return True
-                
-            else:
-                self._log(f"[WARN] Unknown source: {source}")
-                return False
-                
+            return handler(sender, reply_text)
         except Exception as e:
             self._log(f"[ERROR] Failed to send reply: {e}")
             return False
     
-    def process_message(self, filepath):
+    async def read_inbox_files(self, filepaths):
+        """Read and parse several inbox files concurrently."""
+        return await asyncio.gather(
+            *(asyncio.to_thread(self.read_inbox_file, filepath) for filepath in filepaths)
+        )
+    
+    def process_message(self, filepath, parsed=None):
         """Process a single inbox message."""
         self._log(f"[PROCESS] {os.path.basename(filepath)}")
         
-        # Read message
-        metadata, message_text = self.read_inbox_file(filepath)
+        # Read message (unless already parsed by the caller)
+        metadata, message_text = parsed if parsed is not None else self.read_inbox_file(filepath)
         
         if not message_text:
             self._log("[WARN] Empty message, skipping")
@@ -249,17 +266,13 @@ class InboxProcessor:
             filename = os.path.basename(filepath)
             dest_path = os.path.join(DONE_DIR, filename)
             
-            # Add completion metadata
-            with open(filepath, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
             completion_note = f"\n\n---\ncompleted: {datetime.now().isoformat()}\nstatus: completed\n---\n"
             
-            with open(dest_path, 'w', encoding='utf-8') as f:
-                f.write(content + completion_note)
+            # Append completion metadata in place, then rename (no content copy)
+            with open(filepath, 'a', encoding='utf-8') as f:
+                f.write(completion_note)
             
-            # Remove from Inbox
-            os.remove(filepath)
+            os.replace(filepath, dest_path)
             
             self._log(f"[DONE] Moved to Done/: {filename}")
             
@@ -273,7 +286,7 @@ class InboxProcessor:
         self._log("=" * 60)
         
         # Get all markdown files in Inbox
-        inbox_files = list(Path(INBOX_DIR).glob("*.md"))
+        inbox_files = list_inbox_files()
         
         if not inbox_files:
             self._log("[INFO] Inbox is empty")
@@ -281,9 +294,12 @@ class InboxProcessor:
         
         self._log(f"[INFO] Found {len(inbox_files)} messages to process")
         
-        # Process each file
-        for filepath in sorted(inbox_files):
-            self.process_message(str(filepath))
+        # Read all files concurrently, then send replies one at a time
+        inbox_files.sort()
+        parsed_files = asyncio.run(self.read_inbox_files(inbox_files))
+        
+        for filepath, parsed in zip(inbox_files, parsed_files):
+            self.process_message(filepath, parsed)
             
             # Small delay between processing
             time.sleep(1)
@@ -304,7 +320,7 @@ class InboxProcessor:
         try:
             while True:
                 # Get current inbox files
-                current_files = set(str(f) for f in Path(INBOX_DIR).glob("*.md"))
+                current_files = set(list_inbox_files())
                 
                 # Find new files
                 new_files = current_files - last_processed
@@ -7,7 +7,10 @@ Automatically creates and posts content to your LinkedIn profile.
 import os
 import json
 import time
+import queue
+import atexit
 import logging
+from logging.handlers import QueueHandler, QueueListener
 from datetime import datetime, timedelta
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -17,17 +20,28 @@ from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from webdriver_manager.chrome import ChromeDriverManager
 
-# Setup logging
+# Setup logging: records go through a queue so file/console writes happen on a
+# listener thread instead of blocking the WebDriver calls while posting
+_log_queue = queue.SimpleQueue()
+_log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_file_handler = logging.FileHandler('linkedin_automation.log')
+_file_handler.setFormatter(_log_formatter)
+_stream_handler = logging.StreamHandler()
+_stream_handler.setFormatter(_log_formatter)
+_log_listener = QueueListener(_log_queue, _file_handler, _stream_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('linkedin_automation.log'),
-        logging.StreamHandler()
-    ]
+    format='%(message)s',
+    handlers=[QueueHandler(_log_queue)]
 )
 logger = logging.getLogger(__name__)
 
+# Characters sent per send_keys call when typing post content
+TYPING_CHUNK_SIZE = 64
+
 class LinkedInAutomation:
     """
     Automated LinkedIn posting and monitoring.
@@ -215,10 +229,10 @@ class LinkedInAutomation:
             # Build content
             full_content = f"{content['hook']}\n\n{content['body']}\n\n{content['hashtags']}\n\n#AIEmployee #BusinessAutomation #Consulting"
 
-            # Type content character by character for better reliability
-            for char in full_content:
-                text_area.send_keys(char)
-                time.sleep(0.01)
+            # Type content in chunks: one WebDriver round-trip per chunk instead of per character
+            for start in range(0, len(full_content), TYPING_CHUNK_SIZE):
+                text_area.send_keys(full_content[start:start + TYPING_CHUNK_SIZE])
+                time.sleep(0.05)
 
             time.sleep(3)
 
@@ -17,8 +17,9 @@ import os
 import sys
 import json
 import io
+import time
 from datetime import datetime
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 from urllib.parse import urlparse, parse_qs
 import threading
 
@@ -37,6 +38,126 @@ except ImportError:
 
 PORT = 3001
 PHASE3_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BRIEFING_FILE = os.path.join(PHASE3_DIR, "CEO_Briefing.md")
+VAULT_SUMMARY_TTL = 5  # seconds before the directory signature is re-checked
+VAULT_SUMMARY_MAX_AGE = 60  # rebuild regardless (nested writes don't change the signature)
+SKIP_DIRS = frozenset({'node_modules', '.venv', '__pycache__', '.git'})
+
+_summary_lock = threading.Lock()
+_stats_lock = threading.Lock()
+_audit_lock = threading.Lock()
+_audit_skill = None
+_summary_cache = {"key": None, "checked": 0.0, "built": 0.0, "summary": None}
+
+
+def _count_files(directory):
+    """Recursively count files under directory using os.scandir."""
+    count = 0
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in SKIP_DIRS:
+                        count += _count_files(entry.path)
+                elif entry.is_file():
+                    count += 1
+    except OSError:
+        pass
+    return count
+
+
+def _scan_dir(directory):
+    """Count files under directory and return (count, top-level file entries)."""
+    count = 0
+    files = []
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in SKIP_DIRS:
+                        count += _count_files(entry.path)
+                elif entry.is_file():
+                    count += 1
+                    files.append(entry)
+    except OSError:
+        pass
+    return count, files
+
+
+def _vault_signature():
+    """Cheap cache key: mtimes of the top-level vault directories."""
+    key = []
+    with os.scandir(PHASE3_DIR) as it:
+        for entry in it:
+            if entry.is_dir() and entry.name not in SKIP_DIRS:
+                key.append((entry.name, entry.stat().st_mtime_ns))
+    return tuple(sorted(key))
+
+
+def _build_vault_summary():
+    """Walk the vault and build the /vault-summary payload."""
+    summary = {
+        "directories": {},
+        "files": {},
+        "logs": {}
+    }
+    
+    # Count directories, collecting Logs/Inbox/Reports listings in the same pass
+    with os.scandir(PHASE3_DIR) as it:
+        entries = [entry for entry in it if entry.is_dir()]
+    
+    for entry in entries:
+        item = entry.name
+        if item not in SKIP_DIRS:
+            count, files = _scan_dir(entry.path)
+            summary["directories"][item] = count
+            
+            if item == "Logs":
+                log_files = [f.name for f in files if f.name.endswith('.log')]
+                summary["logs"] = {
+                    "count": len(log_files),
+                    "files": log_files
+                }
+            elif item == "Inbox":
+                summary["files"]["inbox_items"] = sum(1 for f in files if f.name.endswith('.md'))
+            elif item == "Reports":
+                summary["files"]["reports"] = sum(1 for f in files if f.name.endswith(('.json', '.md')))
+    
+    return summary
+
+
+def get_vault_summary():
+    """Return the vault summary, rebuilding it only when the vault has changed."""
+    with _summary_lock:
+        now = time.monotonic()
+        cached = _summary_cache["summary"]
+        if cached is not None and now - _summary_cache["checked"] < VAULT_SUMMARY_TTL:
+            return cached
+        
+        key = _vault_signature()
+        if (cached is None or key != _summary_cache["key"]
+                or now - _summary_cache["built"] >= VAULT_SUMMARY_MAX_AGE):
+            _summary_cache["summary"] = _build_vault_summary()
+            _summary_cache["key"] = key
+            _summary_cache["built"] = now
+        _summary_cache["checked"] = now
+        return _summary_cache["summary"]
+
+
+def get_audit_skill():
+    """Return the shared WeeklyAuditSkill, creating it on first use."""
+    global _audit_skill
+    if _audit_skill is None:
+        with _audit_lock:
+            if _audit_skill is None:
+                _audit_skill = WeeklyAuditSkill()
+    return _audit_skill
+
+
+def invalidate_vault_summary():
+    """Drop the cached vault summary after the audit writes new files."""
+    with _summary_lock:
+        _summary_cache["summary"] = None
 
 
 class AuditMCPServer(BaseHTTPRequestHandler):
@@ -50,17 +171,25 @@ class AuditMCPServer(BaseHTTPRequestHandler):
         "start_time": datetime.now().isoformat()
     }
     
+    @classmethod
+    def bump_stat(cls, key):
+        """Increment a server counter (handlers run on concurrent threads)."""
+        with _stats_lock:
+            cls.stats[key] += 1
+    
     def log_message(self, format, *args):
         """Custom log format"""
         print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] {args[0]}")
     
     def send_json_response(self, data, status=200):
         """Send JSON response"""
+        body = json.dumps(data).encode()
         self.send_response(status)
         self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
         self.send_header('Access-Control-Allow-Origin', '*')
         self.end_headers()
-        self.wfile.write(json.dumps(data, indent=2).encode())
+        self.wfile.write(body)
     
     def send_error_response(self, message, status=500):
         """Send error response"""
@@ -75,11 +204,13 @@ class AuditMCPServer(BaseHTTPRequestHandler):
         self.send_header('Access-Control-Allow-Origin', '*')
         self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
         self.send_header('Access-Control-Allow-Headers', 'Content-Type')
+        self.send_header('Content-Length', '0')
         self.end_headers()
     
     def do_GET(self):
         """Handle GET requests"""
-        AuditMCPServer.stats["requests"] += 1
+        self.now = datetime.now()
+        AuditMCPServer.bump_stat("requests")
         parsed_path = urlparse(self.path)
         path = parsed_path.path
         
@@ -96,7 +227,8 @@ class AuditMCPServer(BaseHTTPRequestHandler):
     
     def do_POST(self):
         """Handle POST requests"""
-        AuditMCPServer.stats["requests"] += 1
+        self.now = datetime.now()
+        AuditMCPServer.bump_stat("requests")
         parsed_path = urlparse(self.path)
         path = parsed_path.path
         
@@ -113,7 +245,7 @@ class AuditMCPServer(BaseHTTPRequestHandler):
             "status": "healthy",
             "service": "audit-mcp-server",
             "port": PORT,
-            "uptime": datetime.now().isoformat(),
+            "uptime": self.now.isoformat(),
             "stats": AuditMCPServer.stats
         })
     
@@ -128,8 +260,7 @@ class AuditMCPServer(BaseHTTPRequestHandler):
         """Get current CEO briefing"""
         try:
             # Look for latest briefing
-            reports_dir = os.path.join(PHASE3_DIR, "Reports")
-            briefing_file = os.path.join(PHASE3_DIR, "CEO_Briefing.md")
+            briefing_file = BRIEFING_FILE
             
             if os.path.exists(briefing_file):
                 with open(briefing_file, 'r', encoding='utf-8') as f:
@@ -152,10 +283,12 @@ class AuditMCPServer(BaseHTTPRequestHandler):
                 self.send_error_response("WeeklyAuditSkill not available")
                 return
             
-            audit = WeeklyAuditSkill()
-            briefing_path = audit.generate_ceo_briefing()
+            audit = get_audit_skill()
+            with _audit_lock:
+                briefing_path = audit.generate_ceo_briefing(self.now)
             
-            AuditMCPServer.stats["briefings_generated"] += 1
+            AuditMCPServer.bump_stat("briefings_generated")
+            invalidate_vault_summary()
             
             self.send_json_response({
                 "success": True,
@@ -168,44 +301,9 @@ class AuditMCPServer(BaseHTTPRequestHandler):
     def handle_vault_summary(self):
         """Get summary of vault contents"""
         try:
-            summary = {
-                "directories": {},
-                "files": {},
-                "logs": {}
-            }
-            
-            # Count directories
-            for item in os.listdir(PHASE3_DIR):
-                item_path = os.path.join(PHASE3_DIR, item)
-                if os.path.isdir(item_path):
-                    if item not in ['node_modules', '.venv', '__pycache__']:
-                        count = sum(len(files) for _, _, files in os.walk(item_path))
-                        summary["directories"][item] = count
-            
-            # Count log files
-            logs_dir = os.path.join(PHASE3_DIR, "Logs")
-            if os.path.exists(logs_dir):
-                log_files = [f for f in os.listdir(logs_dir) if f.endswith('.log')]
-                summary["logs"] = {
-                    "count": len(log_files),
-                    "files": log_files
-                }
-            
-            # Count inbox items
-            inbox_dir = os.path.join(PHASE3_DIR, "Inbox")
-            if os.path.exists(inbox_dir):
-                inbox_count = len([f for f in os.listdir(inbox_dir) if f.endswith('.md')])
-                summary["files"]["inbox_items"] = inbox_count
-            
-            # Count reports
-            reports_dir = os.path.join(PHASE3_DIR, "Reports")
-            if os.path.exists(reports_dir):
-                report_count = len([f for f in os.listdir(reports_dir) if f.endswith('.json') or f.endswith('.md')])
-                summary["files"]["reports"] = report_count
-            
             self.send_json_response({
                 "success": True,
-                "summary": summary
+                "summary": get_vault_summary()
             })
         except Exception as e:
             self.send_error_response(str(e))
@@ -217,10 +315,12 @@ class AuditMCPServer(BaseHTTPRequestHandler):
                 self.send_error_response("WeeklyAuditSkill not available")
                 return
             
-            audit = WeeklyAuditSkill()
-            report = audit.generate_weekly_report()
+            audit = get_audit_skill()
+            with _audit_lock:
+                report = audit.generate_weekly_report(self.now)
             
-            AuditMCPServer.stats["audits_run"] += 1
+            AuditMCPServer.bump_stat("audits_run")
+            invalidate_vault_summary()
             
             self.send_json_response({
                 "success": True,
@@ -234,7 +334,7 @@ class AuditMCPServer(BaseHTTPRequestHandler):
 def run_server():
     """Run the Audit MCP Server"""
     server_address = ('', PORT)
-    httpd = HTTPServer(server_address, AuditMCPServer)
+    httpd = ThreadingHTTPServer(server_address, AuditMCPServer)
     
     print(f"🚀 Audit MCP Server running on port {PORT}")
     print(f"   Endpoints:")
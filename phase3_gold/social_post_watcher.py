@@ -18,6 +18,8 @@ import os
 import sys
 import json
 import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
@@ -69,6 +71,7 @@ class SocialPostWatcher:
         self.tw_skill = TwitterAPISkill() if TwitterAPISkill else None
         self.wa_skill = WhatsAppAPISkill() if WhatsAppAPISkill else None
 
+        self._stats_lock = threading.Lock()  # platforms post concurrently in post_to_all
         self.stats = {
             "total_posts": 0,
             "facebook_posts": 0,
@@ -124,12 +127,16 @@ class SocialPostWatcher:
         
         result = self.fb_skill.post(text, image_path)
         
+        with self._stats_lock:
+            if result.get("success"):
+                self.stats["facebook_posts"] += 1
+                self.stats["total_posts"] += 1
+            else:
+                self.stats["errors"] += 1
+
         if result.get("success"):
-            self.stats["facebook_posts"] += 1
-            self.stats["total_posts"] += 1
             self._save_audit("facebook_post", {"text": text[:100], "image": image_path}, True)
         else:
-            self.stats["errors"] += 1
             self._save_audit("facebook_post", {"text": text[:100], "error": result.get("error")}, False)
         
         return result
@@ -144,12 +151,16 @@ class SocialPostWatcher:
         
         result = self.ig_skill.post(caption, image_path)
         
+        with self._stats_lock:
+            if result.get("success"):
+                self.stats["instagram_posts"] += 1
+                self.stats["total_posts"] += 1
+            else:
+                self.stats["errors"] += 1
+
         if result.get("success"):
-            self.stats["instagram_posts"] += 1
-            self.stats["total_posts"] += 1
             self._save_audit("instagram_post", {"caption": caption[:100], "image": image_path}, True)
         else:
-            self.stats["errors"] += 1
             self._save_audit("instagram_post", {"caption": caption[:100], "error": result.get("error")}, False)
         
         return result
@@ -164,12 +175,16 @@ class SocialPostWatcher:
 
         result = self.tw_skill.post(text, image_path)
 
+        with self._stats_lock:
+            if result.get("success"):
+                self.stats["twitter_posts"] += 1
+                self.stats["total_posts"] += 1
+            else:
+                self.stats["errors"] += 1
+
         if result.get("success"):
-            self.stats["twitter_posts"] += 1
-            self.stats["total_posts"] += 1
             self._save_audit("twitter_post", {"text": text[:100], "image": image_path}, True)
         else:
-            self.stats["errors"] += 1
             self._save_audit("twitter_post", {"text": text[:100], "error": result.get("error")}, False)
 
         return result
@@ -217,28 +232,34 @@ class SocialPostWatcher:
             "timestamp": datetime.now().isoformat()
         }
 
-        # Post to Facebook
-        if FB_ACCESS_TOKEN and FB_PAGE_ID:
-            results["facebook"] = self.post_to_facebook(text, image_path)
-        else:
-            self._log("[SKIP] Facebook (credentials not configured)")
+        # Platforms are independent, so post to them concurrently
+        pending = {}
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            # Post to Facebook
+            if FB_ACCESS_TOKEN and FB_PAGE_ID:
+                pending["facebook"] = pool.submit(self.post_to_facebook, text, image_path)
+            else:
+                self._log("[SKIP] Facebook (credentials not configured)")
 
-        # Post to Instagram (requires image)
-        if IG_ID and FB_ACCESS_TOKEN:
-            if image_path and os.path.exists(image_path):
-                results["instagram"] = self.post_to_instagram(text, image_path)
+            # Post to Instagram (requires image)
+            if IG_ID and FB_ACCESS_TOKEN:
+                if image_path and os.path.exists(image_path):
+                    pending["instagram"] = pool.submit(self.post_to_instagram, text, image_path)
+                else:
+                    # Use placeholder image from Picsum
+                    self._log("[INFO] Using placeholder image for Instagram")
+                    pending["instagram"] = pool.submit(self.post_to_instagram, text, "https://picsum.photos/seed/aipost/1080/1080.jpg")
             else:
-                # Use placeholder image from Picsum
-                self._log("[INFO] Using placeholder image for Instagram")
-                results["instagram"] = self.post_to_instagram(text, "https://picsum.photos/seed/aipost/1080/1080.jpg")
-        else:
-            self._log("[SKIP] Instagram (credentials not configured)")
+                self._log("[SKIP] Instagram (credentials not configured)")
 
-        # Post to Twitter
-        if self.tw_skill:
-            results["twitter"] = self.post_to_twitter(text, image_path)
-        else:
-            self._log("[SKIP] Twitter (skill not loaded)")
+            # Post to Twitter
+            if self.tw_skill:
+                pending["twitter"] = pool.submit(self.post_to_twitter, text, image_path)
+            else:
+                self._log("[SKIP] Twitter (skill not loaded)")
+
+        for platform, future in pending.items():
+            results[platform] = future.result()
 
         # Send WhatsApp messages
         if whatsapp_recipients and WHATSAPP_PHONE and WHATSAPP_API_KEY:
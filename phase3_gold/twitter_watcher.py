@@ -51,6 +51,7 @@ class TwitterWatcher:
         self.message_count = 0
         self.errors = 0
         self.processed_tweets = set()
+        self._last_had_items = True  # pace page loads until a poll comes back empty
         
     def _log(self, message):
         """Log message with timestamp."""
@@ -257,8 +258,12 @@ status: pending
             self.page.fill('input[type="password"]', TWITTER_PASSWORD)
             self.page.click('button[type="submit"]')
             
-            self.page.wait_for_load_state('networkidle')
-            self.page.wait_for_timeout(5000)
+            # networkidle never settles on X's long-poll connections; wait for the app shell instead
+            self.page.wait_for_load_state('domcontentloaded', timeout=15000)
+            try:
+                self.page.locator('a[data-testid="AppTabBar_Home_Link"], [data-testid="SideNav_NewTweet_Button"]').first.wait_for(timeout=30000)
+            except Exception:
+                self._log("[TW] Home timeline not detected after login")
             
             self._log("[TW] Login attempt complete")
             
@@ -277,13 +282,19 @@ status: pending
         
         try:
             while True:
+                start_count = self.message_count
+                
                 # Check DMs
                 self.check_dms()
                 
-                time.sleep(5)
+                # Human-like pause between page loads only while there is activity;
+                # an idle account is checked back to back
+                if self._last_had_items:
+                    time.sleep(5)
                 
                 # Check mentions
                 self.check_mentions()
+                self._last_had_items = self.message_count > start_count
                 
                 # Wait
                 actual_interval = CHECK_INTERVAL + random.randint(-5, 5)